@@ -8,47 +8,57 @@ import sys
 import subprocess
 import tempfile
 import platform
-import pandas as pd
 import json
+import functools
+import logging
+import weakref
 from pathlib import Path
 
-_NavigationToolbar2Tk = None
-
-# Add debug printing
+# Add debug logging
 DEBUG = True
 
-def debug_print(message):
-    if DEBUG:
-        print(f"DEBUG [APP]: {message}")
+# Module logger; messages are formatted lazily, so nothing is built in release mode
+log = logging.getLogger('quickgantt')
+log.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+if DEBUG and not log.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter("%(levelname)s [APP]: %(message)s"))
+    log.addHandler(_log_handler)
 
 # At the start of the file
-debug_print("Starting app.py")
+log.debug("Starting app.py")
 
 # Only import matplotlib-related modules and main.py after Tk is initialized
 # This prevents them from creating their own Tk instances
-_chart_engine = None
-_plt = None
-_FigureCanvasTkAgg = None
-_NavigationToolbar2Tk = None
-
-def lazy_imports():
-    """Load matplotlib and other modules only when needed"""
-    global _chart_engine, _FigureCanvasTkAgg, _NavigationToolbar2Tk
-    if _chart_engine is None:
-        debug_print("Performing lazy imports")
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-interactive backend
-        from matplotlib import pyplot as plt
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-        import chart_engine
-        _chart_engine = chart_engine
-        _plt = plt
-        _FigureCanvasTkAgg = FigureCanvasTkAgg
-        _NavigationToolbar2Tk = NavigationToolbar2Tk
-        debug_print("Lazy imports completed")
+def __getattr__(name):
+    """
+    Lazily import matplotlib and chart modules on first access (PEP 562).
+    
+    The imported object is stored in the module globals, so later lookups are
+    plain attribute loads and this hook is not called again for that name.
+    """
+    if name == 'chart_engine':
+        log.debug("Lazily importing chart_engine")
+        import chart_engine as value
+    elif name == 'select_colors':
+        from color_selector import select_colors as value
+    elif name == 'mcolors':
+        import matplotlib.colors as value
+    elif name in ('FigureCanvasTkAgg', 'NavigationToolbar2Tk'):
+        from matplotlib.backends import backend_tkagg
+        value = getattr(backend_tkagg, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
+
+# Module-level __getattr__ only runs for attribute access on the module object,
+# so code in this file resolves lazy names through this reference
+_this_module = sys.modules[__name__]
 
 def use_system_appearance():
-    debug_print("Setting system appearance")
+    log.debug("Setting system appearance")
     """Ensure the application uses the system's native appearance controls"""
     if platform.system() == "Windows":
         try:
@@ -73,11 +83,39 @@ else:
     # If running as script
     application_path = os.path.dirname(os.path.abspath(__file__))
 
-def create_sample_file():
-    """Create and open a temporary sample Excel file"""
-    # Create a temporary file that will be deleted when closed
-    temp_dir = tempfile.gettempdir()
-    sample_file_path = os.path.join(temp_dir, "QuickGantt_Sample.xlsx")
+@functools.lru_cache(maxsize=1)
+def _get_windows_apps_use_light_theme() -> int:
+    """
+    Read the Windows 'AppsUseLightTheme' registry value.
+    
+    The value is cached for the lifetime of the process, so the registry is
+    only opened once no matter how many windows check the theme.
+    
+    Returns:
+        0 when apps use dark mode, 1 when they use light mode
+    """
+    import winreg
+    registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
+    key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
+    value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+    return value
+
+@functools.lru_cache(maxsize=1)
+def _settings_file() -> Path:
+    """Return the path of the saved color settings in the user's home directory."""
+    return Path.home() / ".quickgantt" / "color_settings.json"
+
+@functools.lru_cache(maxsize=1)
+def _sample_xlsx_bytes() -> bytes:
+    """
+    Build the sample Excel workbook once and cache its serialized bytes.
+    
+    Returns:
+        Contents of the sample .xlsx file
+    """
+    # Imported here so pandas stays off the startup path
+    import io
+    import pandas as pd
     
     # Sample data based on the image
     data = {
@@ -104,9 +142,101 @@ def create_sample_file():
         ]
     }
     
-    # Create DataFrame and save to Excel
-    df = pd.DataFrame(data)
-    df.to_excel(sample_file_path, index=False)
+    # Create DataFrame and serialize it to Excel in memory
+    buffer = io.BytesIO()
+    pd.DataFrame(data).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+# ttk style settings for the application's dark and light appearance
+_UI_THEMES = {
+    'quickgantt_dark': {
+        'TFrame': {'configure': {'background': '#2d2d2d'}},
+        'TLabel': {'configure': {'background': '#2d2d2d', 'foreground': 'white'}},
+        'TButton': {
+            'configure': {'background': '#404040', 'foreground': 'white'},
+            'map': {'background': [('active', '#505050')], 'foreground': [('active', 'white')]}
+        }
+    },
+    'quickgantt_light': {
+        'TFrame': {'configure': {'background': '#f0f0f0'}},
+        'TLabel': {'configure': {'background': '#f0f0f0', 'foreground': 'black'}},
+        'TButton': {
+            'configure': {'background': '#e0e0e0', 'foreground': 'black'},
+            'map': {'background': [('active', '#d0d0d0')], 'foreground': [('active', 'black')]}
+        }
+    }
+}
+
+@functools.lru_cache(maxsize=1)
+def _get_ttk_style() -> ttk.Style:
+    """
+    Get the shared ttk Style, registering the QuickGantt themes on first use.
+    
+    Both themes derive from the theme active at that point (e.g. the native
+    Windows theme), so switching between them is a single theme_use call.
+    
+    Returns:
+        The ttk Style object with the QuickGantt themes registered
+    """
+    style = ttk.Style()
+    parent = style.theme_use()
+    for name, settings in _UI_THEMES.items():
+        style.theme_create(name, parent=parent, settings=settings)
+    return style
+
+@functools.lru_cache(maxsize=1)
+def _detect_dark() -> bool:
+    """
+    Detect whether the operating system is using a dark appearance.
+    
+    The result is computed once per process and reused by every window.
+    
+    Returns:
+        True if the system uses dark mode, False otherwise (including on errors)
+    """
+    try:
+        if os.name == 'nt':  # Windows
+            return _get_windows_apps_use_light_theme() == 0
+        if platform.system() == "Darwin":  # macOS
+            result = subprocess.run(
+                ['defaults', 'read', '-g', 'AppleInterfaceStyle'],
+                capture_output=True,
+                text=True,
+                timeout=0.2
+            )
+            return result.stdout.strip() == "Dark"
+    except Exception as e:
+        log.debug("Error detecting system theme: %s", e)
+    # Default to light theme for other systems
+    return False
+
+@functools.lru_cache(maxsize=None)
+def _print_temp_path(extension: str) -> str:
+    """
+    Get the reusable temporary file path for print intermediates.
+    
+    Each print overwrites the same file instead of allocating a new one.
+    
+    Args:
+        extension: File extension without the dot, e.g. "pdf" or "png"
+        
+    Returns:
+        Path to the temporary print file
+    """
+    return os.path.join(tempfile.gettempdir(), f"quickgantt_print.{extension}")
+
+def create_sample_file():
+    """Create and open a temporary sample Excel file"""
+    # Create a temporary file that will be deleted when closed
+    temp_dir = tempfile.gettempdir()
+    sample_file_path = os.path.join(temp_dir, "QuickGantt_Sample.xlsx")
+    
+    # Write the cached workbook bytes and make sure they reach the disk before
+    # another process (Excel, the 'open' helper) is asked to read the file
+    with open(sample_file_path, 'wb') as f:
+        f.write(_sample_xlsx_bytes())
+        f.flush()
+        os.fsync(f.fileno())
     
     # Open the file with default application
     try:
@@ -119,7 +249,14 @@ def create_sample_file():
                 "Please use 'Save As...' to save it to your preferred location before making changes."
             )
         elif os.name == 'posix':  # macOS, Linux
-            subprocess.call(['open', sample_file_path])
+            # Launch without waiting so the Tk main loop stays responsive
+            opener = 'open' if platform.system() == "Darwin" else 'xdg-open'
+            subprocess.Popen(
+                [opener, sample_file_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
             messagebox.showinfo(
                 "Sample File Created", 
                 "A sample file has been opened.\n\n"
@@ -176,24 +313,7 @@ class QuickGanttApp:
         
     def check_system_theme(self):
         """Check if system is using dark mode and adjust UI accordingly"""
-        try:
-            if os.name == 'nt':  # Windows
-                import winreg
-                registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-                key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-                value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-                
-                if value == 0:  # Dark mode
-                    self.use_dark_theme()
-                else:  # Light mode
-                    self.use_light_theme()
-            else:
-                # Default to light theme for other systems
-                self.use_light_theme()
-        except Exception as e:
-            # If any error occurs, default to light theme
-            debug_print(f"Error detecting system theme: {e}")
-            self.use_light_theme()
+        (self.use_dark_theme if _detect_dark() else self.use_light_theme)()
 
     def use_dark_theme(self):
         """
@@ -203,27 +323,15 @@ class QuickGanttApp:
         rather than directly configuring widget colors.
         """
         try:
-            # Create and configure ttk style for dark theme
-            style = ttk.Style()
-            
-            # Configure TFrame
-            style.configure('TFrame', background='#2d2d2d')
-            
-            # Configure TLabel
-            style.configure('TLabel', background='#2d2d2d', foreground='white')
-            
-            # Configure TButton
-            style.configure('TButton', background='#404040', foreground='white')
-            style.map('TButton',
-                     background=[('active', '#505050')],
-                     foreground=[('active', 'white')])
+            # Switch to the pre-registered dark ttk theme in a single call
+            _get_ttk_style().theme_use('quickgantt_dark')
             
             # Set window background color
-            self.root.configure(bg='#2d2d2d')
+            self.root.configure(bg=_UI_THEMES['quickgantt_dark']['TFrame']['configure']['background'])
             
-            debug_print("Dark theme applied")
+            log.debug("Dark theme applied")
         except Exception as e:
-            debug_print(f"Error applying dark theme: {e}")
+            log.debug("Error applying dark theme: %s", e)
 
     def use_light_theme(self):
         """
@@ -233,27 +341,15 @@ class QuickGanttApp:
         rather than directly configuring widget colors.
         """
         try:
-            # Create and configure ttk style for light theme
-            style = ttk.Style()
-            
-            # Configure TFrame
-            style.configure('TFrame', background='#f0f0f0')
-            
-            # Configure TLabel
-            style.configure('TLabel', background='#f0f0f0', foreground='black')
-            
-            # Configure TButton
-            style.configure('TButton', background='#e0e0e0', foreground='black')
-            style.map('TButton',
-                    background=[('active', '#d0d0d0')],
-                    foreground=[('active', 'black')])
+            # Switch to the pre-registered light ttk theme in a single call
+            _get_ttk_style().theme_use('quickgantt_light')
             
             # Set window background color
-            self.root.configure(bg='#f0f0f0')
+            self.root.configure(bg=_UI_THEMES['quickgantt_light']['TFrame']['configure']['background'])
             
-            debug_print("Light theme applied")
+            log.debug("Light theme applied")
         except Exception as e:
-            debug_print(f"Error applying light theme: {e}")
+            log.debug("Error applying light theme: %s", e)
         
     def setup_ui(self):
         """Set up the user interface elements."""
@@ -320,9 +416,6 @@ class QuickGanttApp:
         )
         version_label.pack(side=tk.BOTTOM, pady=(20, 0))
         
-        # Make the UI responsive to window resizing
-        self.root.update_idletasks()
-        
     def generate_chart(self):
         """
         Launch the chart generation process with optional color customization.
@@ -331,8 +424,9 @@ class QuickGanttApp:
         with a navigation toolbar.
         """
         try:
-            debug_print("Starting generate_chart")
-            lazy_imports()
+            log.debug("Starting generate_chart")
+            chart_engine = _this_module.chart_engine
+            select_colors = _this_module.select_colors
             
             # Get the Excel file path using tkinter's file dialog
             file_path = filedialog.askopenfilename(
@@ -342,22 +436,21 @@ class QuickGanttApp:
             )
             
             if not file_path:
-                debug_print("No file selected")
+                log.debug("No file selected")
                 return
             
-            # Extract phases from the file for color selection
-            phases = _chart_engine.extract_phases_from_file(file_path)
+            # Parse the workbook once (cached until the file changes) and reuse it
+            # for both the color dialog and the chart
+            df, columns, phases = chart_engine.load_workbook(file_path)
 
             # Always show the color customization dialog now, instead of asking first
-            from color_selector import select_colors
-
             # Get current chart settings (if any)
             current_settings = self.get_saved_color_settings() # This function should be defined to retrieve saved settings
 
             # Open color selector dialog
             color_settings = select_colors(
                 self.root, 
-                phases,
+                phases or [],
                 initial_colors=current_settings.get('phase_colors') if current_settings else None,
                 initial_background=current_settings.get('background_color') if current_settings else None,
                 initial_grid=current_settings.get('grid_color') if current_settings else None
@@ -365,23 +458,24 @@ class QuickGanttApp:
 
             # If user canceled (clicked Cancel button OR closed the window), don't proceed
             if color_settings is None:
-                debug_print("Color selection canceled, not generating chart")
+                log.debug("Color selection canceled, not generating chart")
                 return  # Exit the function without generating a chart
 
             # If we get here, user clicked OK, so save the settings and generate chart
             self.save_color_settings(color_settings)
 
             # Now proceed with chart generation using the selected settings
-            debug_print("Generating chart with custom colors")
-            fig = _chart_engine.create_gantt_from_file(
-                file_path, 
+            log.debug("Generating chart with custom colors")
+            fig = chart_engine.create_gantt_from_df(
+                df, 
                 color_settings['phase_colors'],
                 color_settings['background_color'],
-                color_settings['grid_color']
+                color_settings['grid_color'],
+                columns
             )
             
             if fig:
-                debug_print("Creating chart window")
+                log.debug("Creating chart window")
                 # Create a new top-level window for the chart
                 chart_window = tk.Toplevel(self.root)
                 chart_window.title("Gantt Chart")
@@ -402,20 +496,20 @@ class QuickGanttApp:
                 chart_frame.columnconfigure(0, weight=1)
                 chart_frame.rowconfigure(0, weight=1)
                 
-                debug_print("Creating FigureCanvasTkAgg")
+                log.debug("Creating FigureCanvasTkAgg")
                 # Create a canvas for the figure
-                canvas = _FigureCanvasTkAgg(fig, master=chart_frame)
+                canvas = _this_module.FigureCanvasTkAgg(fig, master=chart_frame)
                 canvas_widget = canvas.get_tk_widget()
                 canvas_widget.grid(row=0, column=0, sticky="nsew")
                 
                 # Add toolbar - also using grid within the toolbar frame
-                debug_print("Adding toolbar")
+                log.debug("Adding toolbar")
                 toolbar_frame = tk.Frame(chart_window)
                 toolbar_frame.grid(row=1, column=0, sticky="ew")
                 
-                # Use the globally imported NavigationToolbar2Tk
+                # Use the lazily imported NavigationToolbar2Tk
                 # Creating a custom toolbar class that uses grid instead of pack
-                class GridNavigationToolbar(_NavigationToolbar2Tk):
+                class GridNavigationToolbar(_this_module.NavigationToolbar2Tk):
                     """
                     Custom navigation toolbar that uses grid layout and customized tooltips.
                     
@@ -423,7 +517,10 @@ class QuickGanttApp:
                     to be more user-friendly for Gantt charts and adds custom functionality
                     for printing and customizing the chart appearance.
                     """
-                    # Override with only the standard buttons we know exist in matplotlib
+                    # Override with only the standard buttons we know exist in matplotlib.
+                    # NavigationToolbar2Tk.__init__ builds its buttons (and loads their
+                    # icons) from self.toolitems, so this class attribute is already the
+                    # list it sees; no icons are loaded for buttons not listed here.
                     toolitems = [
                         ('Home', 'Reset chart to original view', 'home', 'home'),
                         ('Back', 'Back to previous view', 'back', 'back'),
@@ -434,7 +531,7 @@ class QuickGanttApp:
                         ('Save', 'Save the chart', 'filesave', 'save_figure')
                     ]
                     
-                    def __init__(self, canvas, parent, chart_window=None):
+                    def __init__(self, canvas, parent, chart_window=None, app=None):
                         """
                         Initialize the custom navigation toolbar with additional custom buttons.
                         
@@ -442,12 +539,14 @@ class QuickGanttApp:
                             canvas: The matplotlib canvas widget
                             parent: The parent tkinter widget
                             chart_window: The toplevel window containing the chart
+                            app: The QuickGanttApp instance that owns the chart window
                         """
                         # Initialize with standard buttons first
                         super().__init__(canvas, parent)
                         
                         # Store reference to parent window directly rather than trying to access through manager
                         self.parent_window = chart_window  # Use the explicitly passed chart_window
+                        self.app = app
                         
                         # Add spacer (separating standard and custom buttons)
                         separator = tk.Frame(self, width=8, height=24, bd=0)
@@ -482,60 +581,49 @@ class QuickGanttApp:
                         This allows users to change colors without generating a new chart.
                         """
                         try:
-                            # Get the app instance from the parent window
-                            app = None
-                            for widget in self.parent_window.winfo_children():
-                                if hasattr(widget, 'winfo_children'):
-                                    for child in widget.winfo_children():
-                                        if isinstance(child, tk.Frame) and hasattr(child, 'winfo_toplevel'):
-                                            app = child.winfo_toplevel().master
-                                            break
-                            
-                            # If we can't find the app instance, try another approach
-                            if not app or not hasattr(app, 'get_saved_color_settings'):
-                                app = self.parent_window.master
-                            
-                            # Import required modules
-                            from color_selector import select_colors
-                            import matplotlib.colors as mcolors
-                            
                             # Get current chart figure and extract data
                             fig = self.canvas.figure
                             
-                            # Extract phases from the current chart
+                            # Extract phases from the current chart, keeping first-seen order
                             phases = []
+                            seen_phases = set()
                             background_color = fig.get_facecolor()
                             # Convert background color to hex format
                             background_color = convert_color_to_hex(background_color)
                             grid_color = "#ffffff"  # Default
                             
-                            # Extract phases and colors from the current figure
+                            # Find grid color from existing chart; it is the same on every axis
                             for ax in fig.get_axes():
-                                # Find grid color from existing chart
-                                if ax.xaxis.get_gridlines() and len(ax.xaxis.get_gridlines()) > 0:
-                                    grid_color = ax.xaxis.get_gridlines()[0].get_color()
-                                    grid_color = convert_color_to_hex(grid_color)
-                                
+                                gridlines = ax.xaxis.get_gridlines()
+                                if gridlines:
+                                    grid_color = convert_color_to_hex(gridlines[0].get_color())
+                                    break
+                            
+                            # Charts built by chart_engine record the phase of each bar
+                            bar_phases = getattr(fig, 'gantt_bar_phases', None)
+                            if bar_phases:
+                                phases = sorted(set(bar_phases))
+                            
+                            # Otherwise extract phases from the current figure
+                            for ax in ([] if phases else fig.get_axes()):
                                 # Extract phase information from patches (bars)
                                 for patch in ax.patches:
                                     # Try to get the label (phase) from patch properties
                                     # In Gantt charts, usually stored in the patch's custom properties
-                                    if hasattr(patch, 'get_label') and patch.get_label():
-                                        phase = patch.get_label()
-                                        if phase and phase not in phases and phase != "_nolegend_":
-                                            phases.append(phase)
+                                    phase = patch.get_label()
+                                    if phase and phase != "_nolegend_" and phase not in seen_phases:
+                                        seen_phases.add(phase)
+                                        phases.append(phase)
                             
                             # If we couldn't extract phases from the chart, use defaults
                             if not phases:
                                 phases = ["Phase 1", "Phase 2"]
                             
                             # Get current settings
-                            current_settings = None
-                            if hasattr(app, 'get_saved_color_settings'):
-                                current_settings = app.get_saved_color_settings()
+                            current_settings = self.app.get_saved_color_settings()
                             
                             # Open color selector dialog
-                            color_settings = select_colors(
+                            color_settings = _this_module.select_colors(
                                 self.parent_window, 
                                 phases,
                                 initial_colors=current_settings.get('phase_colors') if current_settings else None,
@@ -548,15 +636,14 @@ class QuickGanttApp:
                                 return
                             
                             # Save the settings
-                            if hasattr(app, 'save_color_settings'):
-                                app.save_color_settings(color_settings)
+                            self.app.save_color_settings(color_settings)
                             
                             # Apply the new colors to the existing chart
                             self._apply_colors_to_chart(color_settings)
                             
                         except Exception as e:
                             # Log error but don't crash
-                            print(f"DEBUG [APP]: Error in customize_chart: {e}")
+                            log.debug("Error in customize_chart: %s", e)
                             import traceback
                             traceback.print_exc()
                             messagebox.showerror("Error", f"An error customizing chart: {e}")
@@ -569,53 +656,60 @@ class QuickGanttApp:
                             color_settings: Dictionary containing color settings to apply
                         """
                         try:
-                            import matplotlib.colors as mcolors
                             fig = self.canvas.figure
                             
                             # Apply background color - ensure it's in the right format for matplotlib
                             bg_color = color_settings['background_color']
                             fig.set_facecolor(bg_color)
                             
+                            # These settings are the same for every axis
+                            grid_color = color_settings['grid_color']
+                            phase_colors = color_settings.get('phase_colors', {})
+                            
                             # Apply colors to each element
                             for ax in fig.get_axes():
                                 # Set axis background
                                 ax.set_facecolor(bg_color)
                                 
                                 # Set grid color
-                                grid_color = color_settings['grid_color']
                                 ax.grid(color=grid_color, alpha=0.3)
                                 
-                                # Calculate text color based on background
-                                r, g, b = mcolors.to_rgb(bg_color)
-                                brightness = (r * 299 + g * 587 + b * 114) / 1000
-                                text_color = 'white' if brightness < 0.6 else 'black'
-                                
                                 # Update text colors
                                 ax.title.set_color(grid_color)
                                 ax.xaxis.label.set_color(grid_color)
                                 ax.yaxis.label.set_color(grid_color)
                                 
-                                for label in ax.get_xticklabels() + ax.get_yticklabels():
-                                    label.set_color(grid_color)
-                                
                                 # Update spines
                                 for spine in ax.spines.values():
                                     spine.set_color(grid_color)
                                 
-                                # Update tick colors
-                                ax.tick_params(colors=grid_color)
+                                # Update tick and tick label colors in one batched call
+                                ax.tick_params(colors=grid_color, labelcolor=grid_color)
                                 
-                                # Update phase colors
-                                phase_colors = color_settings.get('phase_colors', {})
-                                for patch in ax.patches:
-                                    if hasattr(patch, 'get_label') and patch.get_label() in phase_colors:
-                                        patch.set_color(phase_colors[patch.get_label()])
+                                # Update phase colors, matching patches to colors in a single pass
+                                recolor = [
+                                    (patch, phase_colors[patch.get_label()])
+                                    for patch in ax.patches
+                                    if patch.get_label() in phase_colors
+                                ]
+                                for patch, color in recolor:
+                                    patch.set_color(color)
+                            
+                            # Recolor the Gantt bars and legend in place
+                            bar_phases = getattr(fig, 'gantt_bar_phases', None)
+                            if bar_phases:
+                                _this_module.chart_engine.update_colors(
+                                    fig.gantt_bars, 
+                                    phase_colors, 
+                                    bar_phases, 
+                                    getattr(fig, 'gantt_legend_phases', None)
+                                )
                             
-                            # Redraw the canvas to show changes
-                            self.canvas.draw()
+                            # Schedule a redraw on the next idle cycle to show changes
+                            self.canvas.draw_idle()
                             
                         except Exception as e:
-                            print(f"DEBUG [APP]: Error applying colors: {e}")
+                            log.debug("Error applying colors: %s", e)
                             import traceback
                             traceback.print_exc()
                     
@@ -629,20 +723,28 @@ class QuickGanttApp:
                         try:
                             if platform.system() == "Windows":
                                 # Use native Windows printing
-                                import tempfile
-                                import os
-                                
-                                # Create a temporary directory
-                                temp_dir = tempfile.gettempdir()
-                                temp_file = os.path.join(temp_dir, "quickgantt_print.png")
-                                
-                                # Save figure as high-resolution PNG
-                                self.canvas.figure.savefig(
-                                    temp_file, 
-                                    format="png", 
-                                    dpi=300,  # High resolution for printing
-                                    bbox_inches="tight"
-                                )
+                                # Prefer a PDF: it is much smaller than a high-resolution PNG
+                                # and the Windows "print" verb handles it natively
+                                try:
+                                    temp_file = _print_temp_path("pdf")
+                                    self.canvas.figure.savefig(
+                                        temp_file, 
+                                        format="pdf", 
+                                        dpi=200,  # Print quality; drivers downscale anything higher
+                                        bbox_inches="tight"
+                                    )
+                                    file_type = "PDF"
+                                except Exception as e:
+                                    # Fall back to a PNG if the PDF backend is unavailable
+                                    log.debug("Saving print PDF failed, using PNG: %s", e)
+                                    temp_file = _print_temp_path("png")
+                                    self.canvas.figure.savefig(
+                                        temp_file, 
+                                        format="png", 
+                                        dpi=200,
+                                        bbox_inches="tight"
+                                    )
+                                    file_type = "PNG"
                                 
                                 # Open the native print dialog
                                 try:
@@ -652,27 +754,19 @@ class QuickGanttApp:
                                     # If startfile fails, show a message with file location
                                     messagebox.showinfo(
                                         "Print Chart", 
-                                        f"The chart has been saved as a PNG at:\n{temp_file}\n\n"
-                                        "You can open this file and print it from any image viewer."
+                                        f"The chart has been saved as a {file_type} at:\n{temp_file}\n\n"
+                                        "You can open this file and print it from any viewer."
                                     )
                             
                             elif platform.system() == "Darwin":  # macOS
                                 # On macOS, save to PDF and open with Preview
-                                import tempfile
-                                import os
-                                import subprocess
-                                
-                                # Create temp PDF file
-                                temp_file = tempfile.NamedTemporaryFile(
-                                    suffix='.pdf',
-                                    delete=False
-                                ).name
+                                temp_file = _print_temp_path("pdf")
                                 
                                 # Save figure as PDF
                                 self.canvas.figure.savefig(
                                     temp_file, 
                                     format="pdf", 
-                                    dpi=300,
+                                    dpi=200,  # Resolution of the rasterized bars and gridlines
                                     bbox_inches="tight"
                                 )
                                 
@@ -681,20 +775,13 @@ class QuickGanttApp:
                             
                             else:  # Linux or other
                                 # For Linux, use xdg-open with a PDF
-                                import tempfile
-                                import subprocess
-                                
-                                # Create temp PDF file
-                                temp_file = tempfile.NamedTemporaryFile(
-                                    suffix='.pdf',
-                                    delete=False
-                                ).name
+                                temp_file = _print_temp_path("pdf")
                                 
                                 # Save figure as PDF
                                 self.canvas.figure.savefig(
                                     temp_file, 
                                     format="pdf", 
-                                    dpi=300,
+                                    dpi=200,  # Resolution of the rasterized bars and gridlines
                                     bbox_inches="tight"
                                 )
                                 
@@ -710,7 +797,7 @@ class QuickGanttApp:
                                     )
                                 
                         except Exception as e:
-                            print(f"DEBUG [APP]: Error in print_figure: {e}")
+                            log.debug("Error in print_figure: %s", e)
                             # Fall back to matplotlib's built-in print
                             messagebox.showinfo(
                                 "Print Chart", 
@@ -718,8 +805,8 @@ class QuickGanttApp:
                             )
                             self.save_figure()  # Use the save dialog as a fallback
                 
-                # Use our modified toolbar class, passing the chart_window explicitly
-                toolbar = GridNavigationToolbar(canvas, toolbar_frame, chart_window)
+                # Use our modified toolbar class, passing the chart_window and app explicitly
+                toolbar = GridNavigationToolbar(canvas, toolbar_frame, chart_window=chart_window, app=self)
                 toolbar.update()
                 
                 def ensure_window_on_top(self, window: tk.Toplevel) -> None:
@@ -756,25 +843,25 @@ class QuickGanttApp:
                             import ctypes
                             ctypes.windll.user32.SetForegroundWindow(window.winfo_id())
                         except Exception:
-                            debug_print("Windows-specific window activation failed, using standard methods")
+                            log.debug("Windows-specific window activation failed, using standard methods")
                     
                     # One more update to ensure changes take effect
                     window.update()
                 
         except Exception as e:
-            debug_print(f"Error in generate_chart: {e}")
+            log.debug("Error in generate_chart: %s", e)
             import traceback
             traceback.print_exc()
             messagebox.showerror("Error", f"An error occurred: {e}")
 
     def on_main_window_close(self):
         """Handle main window closing event"""
-        debug_print("Main window closing")
+        log.debug("Main window closing")
         self.root.destroy()
 
     def on_chart_window_close(self, window):
         """Handle chart window closing event"""
-        debug_print("Chart window closing")
+        log.debug("Chart window closing")
         window.destroy()
 
     def get_saved_color_settings(self) -> dict:
@@ -785,26 +872,13 @@ class QuickGanttApp:
             Dictionary containing color settings or None if no saved settings exist
         """
         try:
-            # Define path for settings file in user's home directory
-            settings_dir = Path.home() / ".quickgantt"
-            settings_file = settings_dir / "color_settings.json"
-            
-            # Create directory if it doesn't exist
-            if not settings_dir.exists():
-                settings_dir.mkdir(exist_ok=True)
-                
-            # Check if settings file exists
-            if not settings_file.exists():
-                return None
-                
             # Read and parse settings file
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-                
-            return settings
+            return json.loads(_settings_file().read_text())
+        except FileNotFoundError:
+            return None
         except Exception as e:
             # Log error but don't crash the application
-            print(f"DEBUG [APP]: Error loading saved color settings: {e}")
+            log.debug("Error loading saved color settings: %s", e)
             return None
 
     def save_color_settings(self, settings: dict) -> None:
@@ -815,21 +889,18 @@ class QuickGanttApp:
             settings: Dictionary containing color settings to save
         """
         try:
-            # Define path for settings file in user's home directory
-            settings_dir = Path.home() / ".quickgantt"
-            settings_file = settings_dir / "color_settings.json"
+            settings_file = _settings_file()
+            settings_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create directory if it doesn't exist
-            if not settings_dir.exists():
-                settings_dir.mkdir(exist_ok=True)
-                
-            # Write settings to file
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Write to a temporary file and swap it in, so an interrupted write
+            # never leaves a corrupt settings file behind
+            temp_file = settings_file.with_suffix('.json.tmp')
+            temp_file.write_text(json.dumps(settings, separators=(',', ':')))
+            os.replace(temp_file, settings_file)
                 
         except Exception as e:
             # Log error but don't crash the application
-            print(f"DEBUG [APP]: Error saving color settings: {e}")
+            log.debug("Error saving color settings: %s", e)
 
 def convert_color_to_hex(color) -> str:
     """
@@ -841,38 +912,41 @@ def convert_color_to_hex(color) -> str:
     Returns:
         Color in hex string format (#RRGGBB)
     """
-    import matplotlib.colors as mcolors
-    
-    # If it's already a hex color, return it
-    if isinstance(color, str) and color.startswith('#') and len(color) in (7, 9):
-        return color[:7]  # Strip alpha if present
+    try:
+        return _this_module.mcolors.to_hex(color, keep_alpha=False)
+    except (ValueError, TypeError):
+        # Default to a safe color if conversion fails
+        return "#1f2937"
+
+# Icon image shared by the main window and all dialogs
+_ICON_PHOTO = None
+
+@functools.lru_cache(maxsize=1)
+def _find_icon_paths(system: str) -> tuple:
+    """
+    Return the existing icon files for this platform, in order of preference.
     
-    # Convert to RGB if it's a string representation of RGB or RGBA values
-    if isinstance(color, str):
-        try:
-            # Try to interpret as a matplotlib color
-            rgba = mcolors.to_rgba(color)
-            return '#{:02x}{:02x}{:02x}'.format(
-                int(rgba[0] * 255),
-                int(rgba[1] * 255),
-                int(rgba[2] * 255)
-            )
-        except ValueError:
-            # Default to a safe color if conversion fails
-            return "#1f2937"
-    
-    # If it's a tuple of RGB or RGBA values
-    if isinstance(color, tuple) or isinstance(color, list):
-        # Ensure values are in 0-1 range
-        rgb = color[:3]  # Use just the RGB part
-        return '#{:02x}{:02x}{:02x}'.format(
-            int(rgb[0] * 255),
-            int(rgb[1] * 255),
-            int(rgb[2] * 255)
-        )
+    Args:
+        system: Name of the platform as returned by platform.system()
+    """
+    if system == "Windows":
+        # Windows: Try .ico first, fall back to .png
+        candidates = ("icon.ico", "gantt_icon.ico", "icon.png", "gantt_icon.png")
+    else:
+        # macOS/Linux: Try .png first, then .ico
+        candidates = ("icon.png", "gantt_icon.png", "icon.ico", "gantt_icon.ico")
     
-    # Default color if all else fails
-    return "#1f2937"
+    icon_paths = tuple(p for p in (Path("assets") / name for name in candidates) if p.exists())
+    if not icon_paths:
+        log.debug("No icon files found in assets")
+    return icon_paths
+
+def _get_icon_photo(root: tk.Tk, icon_path: Path) -> tk.PhotoImage:
+    """Load the icon image once and reuse it on later calls."""
+    global _ICON_PHOTO
+    if _ICON_PHOTO is None:
+        _ICON_PHOTO = tk.PhotoImage(master=root, file=str(icon_path))
+    return _ICON_PHOTO
 
 def setup_app_icon(root: tk.Tk) -> None:
     """
@@ -883,102 +957,87 @@ def setup_app_icon(root: tk.Tk) -> None:
     Args:
         root: The main Tkinter root window
     """
-    # Try various icon formats and locations
-    icon_paths = []
+    system = platform.system()
     
-    if platform.system() == "Windows":
-        # Windows: Try .ico first, fall back to .png
-        icon_paths = [
-            Path("assets/icon.ico"),
-            Path("assets/gantt_icon.ico"),
-            Path("assets/icon.png"),
-            Path("assets/gantt_icon.png")
-        ]
-    else:
-        # macOS/Linux: Try .png first, then .ico
-        icon_paths = [
-            Path("assets/icon.png"),
-            Path("assets/gantt_icon.png"),
-            Path("assets/icon.ico"),
-            Path("assets/gantt_icon.ico")
-        ]
-    
-    # Try each icon path until one works
-    for icon_path in icon_paths:
-        if not icon_path.exists():
-            debug_print(f"Icon file not found: {icon_path}")
-            continue
-            
+    # Try each existing icon file until one works
+    for icon_path in _find_icon_paths(system):
         try:
-            if platform.system() == "Windows":
+            if system == "Windows":
                 try:
                     # Try setting the window icon using iconbitmap first (Windows preferred)
                     root.iconbitmap(default=str(icon_path))
-                    debug_print(f"Set application icon with iconbitmap: {icon_path}")
+                    log.debug("Set application icon with iconbitmap: %s", icon_path)
                     return
                 except tk.TclError:
                     # If .ico format fails, try PhotoImage method instead
                     if str(icon_path).lower().endswith('.png'):
-                        img = tk.PhotoImage(file=str(icon_path))
-                        root.iconphoto(True, img)
-                        debug_print(f"Set application icon with iconphoto: {icon_path}")
+                        root.iconphoto(True, _get_icon_photo(root, icon_path))
+                        log.debug("Set application icon with iconphoto: %s", icon_path)
                         return
             else:
                 # For Linux and macOS
-                img = tk.PhotoImage(file=str(icon_path))
-                root.iconphoto(True, img)
-                debug_print(f"Set application icon with iconphoto: {icon_path}")
+                root.iconphoto(True, _get_icon_photo(root, icon_path))
+                log.debug("Set application icon with iconphoto: %s", icon_path)
                 return
                 
         except Exception as e:
-            debug_print(f"Error setting application icon with {icon_path}: {e}")
+            log.debug("Error setting application icon with %s: %s", icon_path, e)
     
-    debug_print("Could not set any application icon")
+    log.debug("Could not set any application icon")
 
 # Modify the __main__ section to destroy the unwanted tk window
 
 if __name__ == "__main__":
-    debug_print("In __main__")
+    log.debug("In __main__")
     use_system_appearance()
     
     # Find all existing Tk windows before creating our own
-    debug_print("Looking for existing Tk instances")
-    import gc
-    tk_windows = []
+    log.debug("Looking for existing Tk instances")
     
     # First check if tk._default_root already exists (created by another module)
     if tk._default_root is not None:
-        debug_print(f"Found existing tk._default_root: {tk._default_root}, title: {tk._default_root.title()}")
+        log.debug("Found existing tk._default_root: %s, title: %s", tk._default_root, tk._default_root.title())
         if tk._default_root.title() == "tk":
-            debug_print("Destroying default root window with title 'tk'")
+            log.debug("Destroying default root window with title 'tk'")
             tk._default_root.withdraw()  # Hide it
             tk._default_root.destroy()
             tk._default_root = None
     
+    # Track every Tk instance created from here on, so the final check only
+    # looks at those instead of scanning the whole heap
+    tk_windows = weakref.WeakSet()
+    _tk_init = tk.Tk.__init__
+    
+    def _tracked_tk_init(self, *args, **kwargs):
+        _tk_init(self, *args, **kwargs)
+        tk_windows.add(self)
+    
+    tk.Tk.__init__ = _tracked_tk_init
+    
     # Now create our window
-    debug_print("Creating our root Tk instance")
+    log.debug("Creating our root Tk instance")
     root = tk.Tk()
     root.title("QuickGantt")  # Set title immediately
     
     # Run a final check after a slight delay to catch any other windows
     def finalize_setup():
-        debug_print("Finalizing setup and checking for extra windows")
+        log.debug("Finalizing setup and checking for extra windows")
         extra_windows = []
-        for obj in gc.get_objects():
-            if isinstance(obj, tk.Tk) and obj != root:
+        for obj in list(tk_windows):
+            if obj != root:
                 extra_windows.append(obj)
-                debug_print(f"Found extra Tk window: {obj}, title: {obj.title()}")
+                log.debug("Found extra Tk window: %s, title: %s", obj, obj.title())
                 if obj.title() == "tk":
-                    debug_print("Attempting to destroy extra 'tk' window")
+                    log.debug("Attempting to destroy extra 'tk' window")
                     try:
                         obj.withdraw()
                         obj.destroy()
-                        debug_print("Extra 'tk' window destroyed")
+                        log.debug("Extra 'tk' window destroyed")
                     except Exception as e:
-                        debug_print(f"Error destroying extra window: {e}")
+                        log.debug("Error destroying extra window: %s", e)
         
         if not extra_windows:
-            debug_print("No extra windows found, app is clean!")
+            log.debug("No extra windows found, app is clean!")
     
     # Run our cleanup after a brief delay
     root.after(100, finalize_setup)
@@ -990,7 +1049,7 @@ if __name__ == "__main__":
     setup_app_icon(root)
     
     # Continue with app creation
-    debug_print("Creating QuickGanttApp")
+    log.debug("Creating QuickGanttApp")
     app = QuickGanttApp(root)
-    debug_print("Starting mainloop")
+    log.debug("Starting mainloop")
     root.mainloop()
\ No newline at end of file
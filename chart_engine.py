@@ -2,26 +2,90 @@
 Chart engine that handles matplotlib initialization and figure creation
 This separates matplotlib from the main application to prevent unwanted windows
 """
+from __future__ import annotations
+
 import matplotlib
 matplotlib.use('Agg')  # Force non-interactive backend
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import re
-from typing import Dict, List, Optional, Tuple, Union, Any
+import os
+import json
+import hashlib
+import functools
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union, Any, TYPE_CHECKING
 import logging
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+# pandas, numpy and pyplot take a noticeable time to import, so they are only
+# loaded once a chart function actually needs them
+_LAZY_NAMES = (
+    'pd', 'np', 'plt', 'mdates', 'mcolors', 'LineCollection', 'Figure', 'FigureCanvasAgg'
+)
+
+@functools.lru_cache(maxsize=1)
+def _load_libraries() -> None:
+    """Import the data and plotting libraries into the module namespace."""
+    import pandas as pd
+    import numpy as np
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    import matplotlib.colors as mcolors
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    globals().update(
+        pd=pd, np=np, plt=plt, mdates=mdates, mcolors=mcolors, LineCollection=LineCollection,
+        Figure=Figure, FigureCanvasAgg=FigureCanvasAgg
+    )
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _load_libraries()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
 DEBUG = True
 
-def debug_print(message):
-    if DEBUG:
+# Private per-user directory for parsed workbooks, so unchanged files skip
+# Excel parsing. Shared with main.py through load_cache_entry/store_cache_entry
+CACHE_DIR = Path.home() / ".quickgantt" / "cache"
+
+# Stored in each entry's metadata; bump it whenever reading or column detection
+# changes so entries written by older versions are re-parsed
+CACHE_VERSION = 2
+
+# Least recently used entries beyond this count are deleted
+CACHE_MAX_ENTRIES = 32
+
+# Resolved once at import; with DEBUG off (or under python -O) debug_print is a no-op
+if __debug__ and DEBUG:
+    def debug_print(message):
         print(f"DEBUG [CHART]: {message}")
+else:
+    def debug_print(message):
+        pass
+
+# Substring patterns used to detect each standard column, in priority order,
+# plus a precompiled union of them for a fast first check
+_COLUMN_PATTERNS = {
+    key: (re.compile('|'.join(map(re.escape, patterns_list))), patterns_list)
+    for key, patterns_list in {
+        'task': ('task', 'name', 'description'),
+        'duration': ('duration', 'weeks', 'days'),
+        'phase': ('phase', 'category', 'group'),
+        'start_date': ('start', 'begin'),
+        'end_date': ('end', 'finish')
+    }.items()
+}
 
 def process_excel_file(file_path: str) -> plt.Figure:
     """
@@ -35,13 +99,13 @@ def process_excel_file(file_path: str) -> plt.Figure:
     """
     try:
         # Load the data
-        df = pd.read_excel(file_path)
+        df = read_excel(file_path)
         
         # Identify relevant columns
         columns = detect_columns(df)
         
         # Generate the chart
-        fig, _ = create_gantt_chart(df, columns)
+        fig, *_ = create_gantt_chart(df, columns)
         
         return fig
     except Exception as e:
@@ -59,26 +123,23 @@ def detect_columns(df: pd.DataFrame) -> Dict[str, str]:
         Dictionary mapping standard column names to actual column names
     """
     column_mapping = {}
-    columns_lower = {col.lower(): col for col in df.columns}
-    
-    # Define patterns to search for
-    patterns = {
-        'task': ['task', 'name', 'description'],
-        'duration': ['duration', 'weeks', 'days'],
-        'phase': ['phase', 'category', 'group'],
-        'start_date': ['start', 'begin'],
-        'end_date': ['end', 'finish']
-    }
-    
-    # Find matching columns
-    for key, patterns_list in patterns.items():
-        for pattern in patterns_list:
-            for col_lower, col_original in columns_lower.items():
-                if pattern in col_lower:
-                    column_mapping[key] = col_original
-                    break
-            if key in column_mapping:
-                break
+    best_rank = {}
+    
+    # Single pass over the columns; for each key keep the column matching the
+    # highest-priority pattern (earliest column wins ties)
+    for col in df.columns:
+        col_lower = str(col).lower()
+        for key, (combined, patterns_list) in _COLUMN_PATTERNS.items():
+            if best_rank.get(key) == 0 or not combined.search(col_lower):
+                continue
+            rank = next(i for i, pattern in enumerate(patterns_list) if pattern in col_lower)
+            if rank < best_rank.get(key, len(patterns_list)):
+                best_rank[key] = rank
+                column_mapping[key] = col
+        
+        # Stop early once every key has its top-priority match
+        if len(best_rank) == len(_COLUMN_PATTERNS) and not any(best_rank.values()):
+            break
     
     # Validate required columns
     required_cols = ['task', 'start_date', 'end_date']
@@ -95,10 +156,15 @@ def create_gantt_chart(
     custom_colors: Optional[Dict[str, str]] = None,
     background_color: str = "#1f2937",
     grid_color: str = "#ffffff"
-) -> Tuple[plt.Figure, plt.Axes]:
+) -> Tuple[plt.Figure, plt.Axes, Any, Optional[Any]]:
     """
     Create a Gantt chart from the processed data.
     
+    The bars, the phase of each bar, the legend and its (phase, handle)
+    pairs are also stored on the figure (gantt_bars, gantt_bar_phases,
+    gantt_legend, gantt_legend_phases) so update_colors can recolor an
+    existing chart without rebuilding it.
+    
     Args:
         df: DataFrame containing the task data
         columns: Dictionary mapping standard column names to actual column names
@@ -107,8 +173,9 @@ def create_gantt_chart(
         grid_color: Color for grid lines and axes
         
     Returns:
-        Tuple containing the figure and axes objects
+        Tuple containing the figure, axes, bar container and legend (or None)
     """
+    _load_libraries()
     # Extract column names
     task_col = columns['task']
     start_col = columns['start_date']
@@ -116,8 +183,11 @@ def create_gantt_chart(
     phase_col = columns.get('phase')
     duration_col = columns.get('duration')
     
-    # Create figure and axis with custom background
-    fig, ax = plt.subplots(1, 1, figsize=(12, 8), facecolor=background_color)
+    # Create figure and axis with custom background. The figure is not
+    # registered with pyplot, so it is freed once the chart window drops it
+    fig = Figure(figsize=(12, 8), facecolor=background_color)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
     ax.set_facecolor(background_color)
     
     # Process dates if they're not already datetime
@@ -127,7 +197,7 @@ def create_gantt_chart(
         df[end_col] = pd.to_datetime(df[end_col])
     
     # Sort tasks by start date (ascending)
-    df = df.sort_values(by=start_col)
+    df = df.sort_values(by=start_col, kind='mergesort', ignore_index=True)
     
     # Set up color mapping for phases
     colors = plt.cm.Dark2.colors
@@ -149,52 +219,56 @@ def create_gantt_chart(
         color_map = {}
         phases = []
     
-    # Plot each task as a horizontal bar
-    # Track task positions to ensure correct ordering
-    y_positions = []
-    y_ticks = []
+    # Compute task geometry for all rows at once
+    starts = df[start_col].to_numpy()
+    ends = df[end_col].to_numpy()
     
-    # Process tasks from earliest to latest
-    for i, (_, row) in enumerate(df.iterrows()):
-        task = row[task_col]
-        start_date = row[start_col]
-        end_date = row[end_col]
-        
-        # Ensure the task is positioned from top (earliest) to bottom (latest)
-        y_pos = len(df) - 1 - i  # Reverse the position so earliest is at top
-        y_positions.append(y_pos)
-        y_ticks.append(task)
-        
-        # Calculate duration in days
-        duration_days = (end_date - start_date).days
-        if duration_days <= 0:
-            duration_days = 1  # Ensure minimum visible duration
-        
-        # Get color based on phase
-        if phase_col and phase_col in df.columns:
-            phase = row[phase_col]
-            color = color_map.get(phase, 'blue')
-        else:
-            color = 'steelblue'
-        
-        # Plot the task bar
-        ax.barh(y_pos, duration_days, left=start_date, height=0.5, 
-                color=color, edgecolor='black', alpha=0.8)
+    # Duration in whole days, with a minimum visible duration of one day
+    durations = np.maximum((ends - starts) // np.timedelta64(1, 'D'), 1)
+    
+    # Reverse the positions so the earliest task is at the top
+    y_positions = np.arange(len(df) - 1, -1, -1)
+    y_ticks = df[task_col].to_numpy()
+    
+    # Get bar colors based on phase
+    if phase_col and phase_col in df.columns:
+        bar_phases = df[phase_col].tolist()
         
-        # Add duration label
-        if duration_col and duration_col in df.columns:
-            duration_text = f"{row[duration_col]}"
-        else:
-            duration_text = f"{duration_days}d"
-            
-        # Center the text in the bar
-        text_x = start_date + pd.Timedelta(days=duration_days/2)
-        ax.text(text_x, y_pos, duration_text,
+        # Look colors up by phase code; the extra last row is the fallback
+        # color, which code -1 (missing phase) selects
+        categories = [phase for phase in phases if not pd.isna(phase)]
+        codes = pd.Categorical(df[phase_col], categories=categories).codes
+        rgba_table = mcolors.to_rgba_array([color_map[phase] for phase in categories] + ['blue'])
+        bar_colors = rgba_table[codes]
+    else:
+        bar_phases = None
+        bar_colors = 'steelblue'
+    
+    # Plot all task bars with a single call; bar starts are passed as
+    # matplotlib date numbers (days) so the day durations add up correctly
+    starts_num = mdates.date2num(starts)
+    bars = ax.barh(y_positions, durations, left=starts_num, height=0.5, 
+                   color=bar_colors, edgecolor='black', alpha=0.8)
+    ax.xaxis_date()
+    
+    # Rasterize the bars in vector output (PDF/SVG) so large charts stay small;
+    # axes, labels and text remain vectors
+    for bar in bars:
+        bar.set_rasterized(True)
+    
+    # Add duration labels, centered in each bar
+    if duration_col and duration_col in df.columns:
+        duration_texts = [f"{value}" for value in df[duration_col]]
+    else:
+        duration_texts = [f"{days}d" for days in durations]
+    
+    text_x = starts_num + durations / 2
+    for x, y_pos, duration_text in zip(text_x, y_positions, duration_texts):
+        ax.text(x, y_pos, duration_text,
                 ha='center', va='center', color='white', fontweight='bold')
     
     # Set up the axes with task names
-    ax.set_yticks(y_positions)
-    ax.set_yticklabels(y_ticks)
+    ax.set_yticks(y_positions, labels=y_ticks)
     
     # Format the x-axis for dates with custom grid color
     ax.grid(True, axis='x', alpha=0.3, color=grid_color)
@@ -203,13 +277,24 @@ def create_gantt_chart(
     start = df[start_col].min()
     end = df[end_col].max()
     date_range = pd.date_range(start=start, end=end, freq='W')
-    
-    for date in date_range:
-        ax.axvline(date, color=grid_color, linestyle='--', alpha=0.3)
-    
     month_range = pd.date_range(start=start, end=end, freq='MS')
-    for date in month_range:
-        ax.axvline(date, color=grid_color, linestyle='-', alpha=0.2)
+    
+    # One collection per frequency instead of one line artist per date. Lines
+    # span the full axes height like axvline (x in data, y in axes coordinates)
+    for dates, linestyle, alpha in ((date_range, '--', 0.3), (month_range, '-', 0.2)):
+        x_values = mdates.date2num(dates)
+        segments = [[(x, 0), (x, 1)] for x in x_values]
+        ax.add_collection(
+            LineCollection(
+                segments, 
+                colors=grid_color, 
+                linestyles=linestyle, 
+                alpha=alpha, 
+                transform=ax.get_xaxis_transform(), 
+                rasterized=True
+            ),
+            autolim=False
+        )
     
     # Rotate date labels for better readability
     fig.autofmt_xdate()
@@ -224,6 +309,8 @@ def create_gantt_chart(
     ax.set_xlabel('Date', color=grid_color)
     
     # Create a legend with improved visibility if phases are available
+    legend = None
+    legend_phases = []
     if phase_col and phase_col in df.columns and len(phases) > 0:
         handles = [plt.Rectangle((0,0), 1, 1, color=color_map[phase]) for phase in phases]
         legend = ax.legend(
@@ -236,9 +323,45 @@ def create_gantt_chart(
         # Make legend text white for better visibility
         for text in legend.get_texts():
             text.set_color(grid_color)
+        
+        # Keep each phase with the patch the legend draws for it, so colors
+        # can be updated without parsing the (stringified) label text
+        legend_phases = list(zip(phases, legend.get_patches()))
+    
+    fig.tight_layout()
     
-    plt.tight_layout()
-    return fig, ax
+    fig.gantt_bars = bars
+    fig.gantt_bar_phases = bar_phases
+    fig.gantt_legend = legend
+    fig.gantt_legend_phases = legend_phases
+    return fig, ax, bars, legend
+
+def update_colors(
+    bars: Any, 
+    color_map: Dict[str, str], 
+    phase_series: List[str], 
+    legend_phases: Optional[List[Tuple[Any, Any]]] = None
+) -> None:
+    """
+    Recolor the bars (and legend) of an existing chart in place.
+    
+    Args:
+        bars: Bar container returned by create_gantt_chart
+        color_map: Dictionary mapping phases to colors
+        phase_series: Phase of each bar, in bar order
+        legend_phases: Optional (phase, legend handle) pairs, as stored in
+            fig.gantt_legend_phases, whose handles should follow the new colors
+    """
+    for bar, phase in zip(bars, phase_series):
+        if phase in color_map:
+            bar.set_facecolor(color_map[phase])
+    
+    for phase, handle in legend_phases or ():
+        if phase in color_map:
+            handle.set_color(color_map[phase])
+    
+    if len(bars):
+        bars[0].figure.canvas.draw_idle()
 
 def get_available_colormaps() -> List[str]:
     """
@@ -266,33 +389,233 @@ def generate_color_scheme(phases: List[str], colormap_name: str = 'Dark2') -> Di
     Returns:
         Dictionary mapping phases to colors in hex format
     """
-    cmap = plt.cm.get_cmap(colormap_name, max(len(phases), 8))
+    _load_libraries()
+    cmap = matplotlib.colormaps[colormap_name].resampled(max(len(phases), 8))
     
-    # Convert colors to hex format
-    colors = {}
-    for i, phase in enumerate(phases):
-        rgba = cmap(i % cmap.N)
-        hex_color = '#{:02x}{:02x}{:02x}'.format(
-            int(rgba[0] * 255), 
-            int(rgba[1] * 255), 
-            int(rgba[2] * 255)
-        )
-        colors[phase] = hex_color
+    # Sample all colors at once and convert them to hex format
+    rgba = cmap(np.arange(len(phases)) % cmap.N)
+    return dict(zip(phases, (mcolors.to_hex(color) for color in rgba)))
+
+def read_excel(file_path: str) -> pd.DataFrame:
+    """
+    Read an Excel file, loading only the columns the chart uses.
+    
+    Uses the Rust-based calamine engine when python-calamine is installed and
+    falls back to pandas' default (openpyxl) engine otherwise.
     
-    return colors
+    Args:
+        file_path: Path to the Excel file
+        
+    Returns:
+        DataFrame containing the relevant task columns
+    """
+    _load_libraries()
+    # Read just the header row to find the relevant columns
+    try:
+        engine = 'calamine'
+        header = pd.read_excel(file_path, engine=engine, nrows=0)
+    except ImportError:
+        engine = None
+        header = pd.read_excel(file_path, nrows=0)
+    
+    try:
+        usecols = list(dict.fromkeys(detect_columns(header).values()))
+    except ValueError:
+        # Let the full read surface missing columns in the usual place
+        usecols = None
+    
+    return pd.read_excel(file_path, engine=engine, usecols=usecols)
 
-def extract_phases_from_file(file_path: str) -> List[str]:
+def _cache_entry_paths(namespace: str, file_path: str) -> Tuple[Path, Path]:
+    """Return the data and metadata paths of a workbook's cache entry."""
+    digest = hashlib.sha1(f"{namespace}:{file_path}".encode('utf-8')).hexdigest()
+    return CACHE_DIR / f"{digest}.parquet", CACHE_DIR / f"{digest}.json"
+
+def load_cache_entry(
+    namespace: str, 
+    file_path: str, 
+    metadata: Dict[str, Any]
+) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
     """
-    Extract unique phase values from an Excel file.
+    Load a parsed workbook from the on-disk cache.
+    
+    Entries are stored as Parquet, so loading one cannot run code. Without a
+    Parquet engine (pyarrow or fastparquet) every lookup is a miss.
+    
+    Args:
+        namespace: Name of the caller's cache, so different readers of the
+            same workbook keep separate entries
+        file_path: Absolute path to the Excel file
+        metadata: Values the stored metadata must match (cache version,
+            file modification time or content hash, ...)
+        
+    Returns:
+        The cached DataFrame and the full stored metadata, or None on a miss
+    """
+    _load_libraries()
+    data_file, meta_file = _cache_entry_paths(namespace, file_path)
+    try:
+        cached = json.loads(meta_file.read_text())
+        if not isinstance(cached, dict):
+            return None
+        if {key: cached.get(key) for key in metadata} != metadata:
+            return None
+        df = pd.read_parquet(data_file)
+        os.utime(data_file)  # Mark as recently used for pruning
+        return df, cached
+    except Exception:
+        return None
+
+def store_cache_entry(
+    namespace: str, 
+    file_path: str, 
+    metadata: Dict[str, Any], 
+    df: pd.DataFrame
+) -> None:
+    """
+    Store a parsed workbook in the on-disk cache, replacing its old entry.
+    
+    Both files are written under temporary names and then moved into place.
+    Failing to write the cache (no Parquet engine, column types Parquet
+    cannot hold, disk errors) is logged and otherwise ignored.
+    
+    Args:
+        namespace: Name of the caller's cache
+        file_path: Absolute path to the Excel file
+        metadata: JSON-serializable metadata checked by load_cache_entry
+        df: DataFrame to store
+    """
+    _load_libraries()
+    data_file, meta_file = _cache_entry_paths(namespace, file_path)
+    data_tmp = data_file.with_name(f"{data_file.name}.{os.getpid()}.tmp")
+    meta_tmp = meta_file.with_name(f"{meta_file.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(CACHE_DIR, 0o700)
+        df.to_parquet(data_tmp)
+        meta_tmp.write_text(json.dumps(metadata))
+        os.replace(data_tmp, data_file)
+        os.replace(meta_tmp, meta_file)
+        _prune_cache()
+    except Exception as e:
+        logger.debug(f"Could not write workbook cache: {str(e)}")
+        for tmp in (data_tmp, meta_tmp):
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+def _prune_cache() -> None:
+    """Delete the least recently used cache entries beyond CACHE_MAX_ENTRIES."""
+    # Pickled entries from older versions are never loaded; remove them
+    for legacy_file in CACHE_DIR.glob("*.pkl"):
+        legacy_file.unlink(missing_ok=True)
+        legacy_file.with_suffix(".json").unlink(missing_ok=True)
+    
+    entries = sorted(CACHE_DIR.glob("*.parquet"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for data_file in entries[CACHE_MAX_ENTRIES:]:
+        data_file.unlink(missing_ok=True)
+        data_file.with_suffix(".json").unlink(missing_ok=True)
+
+@functools.lru_cache(maxsize=8)
+def _load_dataframe_cached(file_path: str, mtime: float, size: int) -> pd.DataFrame:
+    """
+    Load task data, using the on-disk cache when the file is unchanged.
+    
+    Results are also memoized in-process; mtime and size are part of the
+    cache key so editing the workbook invalidates both caches.
+    
+    Args:
+        file_path: Absolute path to the Excel file
+        mtime: Modification time of the file
+        size: Size of the file in bytes
+        
+    Returns:
+        DataFrame containing the raw task data
+    """
+    metadata = {'version': CACHE_VERSION, 'source': file_path, 'mtime': mtime, 'size': size}
+    
+    # Use the cached copy if it was made from this exact version of the file
+    # by this version of the reader
+    entry = load_cache_entry('workbook', file_path, metadata)
+    if entry is not None:
+        return entry[0]
+    
+    df = read_excel(file_path)
+    store_cache_entry('workbook', file_path, metadata, df)
+    return df
+
+def load_dataframe(file_path: str) -> pd.DataFrame:
+    """
+    Load task data from an Excel file.
+    
+    Parsed workbooks are cached in memory and under CACHE_DIR, keyed on the
+    file's path, modification time and size.
+    
+    Args:
+        file_path: Path to the Excel file
+        
+    Returns:
+        DataFrame containing the raw task data (a copy the caller may modify)
+    """
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    return _load_dataframe_cached(file_path, stat.st_mtime, stat.st_size).copy()
+
+@functools.lru_cache(maxsize=4)
+def _load_workbook_cached(
+    file_path: str, mtime: float, size: int
+) -> Tuple[pd.DataFrame, Dict[str, str], Optional[List[str]]]:
+    """
+    Load task data and detect its columns and phases once per file version.
+    
+    Args:
+        file_path: Absolute path to the Excel file
+        mtime: Modification time of the file
+        size: Size of the file in bytes
+        
+    Returns:
+        Tuple of (DataFrame, detected columns, sorted phases or None)
+    """
+    df = _load_dataframe_cached(file_path, mtime, size)
+    columns = detect_columns(df)
+    phases = None
+    if 'phase' in columns:
+        phases = sorted(df[columns['phase']].unique().tolist())
+    return df, columns, phases
+
+def load_workbook(
+    file_path: str
+) -> Tuple[pd.DataFrame, Dict[str, str], Optional[List[str]]]:
+    """
+    Load task data from an Excel file together with its column mapping.
+    
+    The workbook is parsed and analysed once; later calls for the same,
+    unchanged file reuse the result.
     
     Args:
         file_path: Path to the Excel file
         
+    Returns:
+        Tuple of (DataFrame, detected columns, sorted phases or None when the
+        data has no phase column). All values are copies the caller may modify.
+    """
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    df, columns, phases = _load_workbook_cached(file_path, stat.st_mtime, stat.st_size)
+    return df.copy(), dict(columns), None if phases is None else list(phases)
+
+def extract_phases_from_df(df: pd.DataFrame) -> List[str]:
+    """
+    Extract unique phase values from already loaded task data.
+    
+    Args:
+        df: DataFrame containing the task data
+        
     Returns:
         List of unique phase values
     """
     try:
-        df = pd.read_excel(file_path)
         columns = detect_columns(df)
         
         if 'phase' in columns and columns['phase'] in df.columns:
@@ -304,6 +627,61 @@ def extract_phases_from_file(file_path: str) -> List[str]:
         logger.error(f"Error extracting phases: {str(e)}")
         return []
 
+def extract_phases_from_file(file_path: str) -> List[str]:
+    """
+    Extract unique phase values from an Excel file.
+    
+    Args:
+        file_path: Path to the Excel file
+        
+    Returns:
+        List of unique phase values
+    """
+    try:
+        _, _, phases = load_workbook(file_path)
+        return phases or []
+    except Exception as e:
+        logger.error(f"Error extracting phases: {str(e)}")
+        return []
+
+def create_gantt_from_df(
+    df: pd.DataFrame, 
+    custom_colors: Optional[Dict[str, str]] = None,
+    background_color: str = "#1f2937",
+    grid_color: str = "#ffffff",
+    columns: Optional[Dict[str, str]] = None
+) -> plt.Figure:
+    """
+    Create a Gantt chart from already loaded task data.
+    
+    Args:
+        df: DataFrame containing the task data
+        custom_colors: Optional dictionary mapping phases to custom colors
+        background_color: Color for chart background
+        grid_color: Color for grid lines and axes
+        columns: Column mapping from load_workbook; detected from df if omitted
+        
+    Returns:
+        Matplotlib figure object containing the Gantt chart
+    """
+    _load_libraries()
+    if columns is None:
+        columns = detect_columns(df)
+    
+    # Generate the figure with the chart and custom colors
+    fig, *_ = create_gantt_chart(
+        df, 
+        columns, 
+        custom_colors, 
+        background_color, 
+        grid_color
+    )
+    
+    # Important: Set Matplotlib to use a backend that provides navigation
+    plt.rcParams['toolbar'] = 'toolbar2'
+    
+    return fig
+
 def create_gantt_from_file(
     file_path: str, 
     custom_colors: Optional[Dict[str, str]] = None,
@@ -324,23 +702,14 @@ def create_gantt_from_file(
     """
     logger.debug(f"Creating chart from file: {file_path}")
     try:
-        # Load data once and reuse
-        df = pd.read_excel(file_path)
-        columns = detect_columns(df)
-        
-        # Generate the figure with the chart and custom colors
-        fig, _ = create_gantt_chart(
+        df, columns, _ = load_workbook(file_path)
+        return create_gantt_from_df(
             df, 
-            columns, 
             custom_colors, 
             background_color, 
-            grid_color
+            grid_color,
+            columns
         )
-        
-        # Important: Set Matplotlib to use a backend that provides navigation
-        plt.rcParams['toolbar'] = 'toolbar2'
-        
-        return fig
     except Exception as e:
         logger.debug(f"Error creating chart: {str(e)}")
-        raise
\ No newline at end of file
+        raise
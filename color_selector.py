@@ -6,12 +6,65 @@ import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox  # Added messagebox here
 from tkinter import colorchooser
 from typing import Dict, List, Optional, Tuple, Any
+import bisect
+import functools
+from contextlib import contextmanager
+import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.colors as mcolors
 import json
 from pathlib import Path
 import os
+from collections import OrderedDict
+
+# The preview figures are display-only (never saved or exported), so they are
+# rendered at screen resolution rather than matplotlib's default 100 dpi
+PREVIEW_DPI = 72
+
+# Number of rendered saved-theme previews kept for quick browsing
+THEME_PREVIEW_CACHE_SIZE = 16
+
+@functools.lru_cache(maxsize=32)
+def _get_cmap_hex_list(theme: str, n: int) -> Tuple[str, ...]:
+    """
+    Get the colors of a matplotlib colormap resampled to n entries.
+    
+    Args:
+        theme: Name of the matplotlib colormap
+        n: Number of colors to sample
+        
+    Returns:
+        Tuple of n colors in hex format
+    """
+    cmap = matplotlib.colormaps[theme].resampled(n)
+    
+    # Let the colormap emit 8-bit channels directly and hex-encode each row
+    rgb = cmap(np.arange(cmap.N), bytes=True)[:, :3].tobytes().hex()
+    return tuple('#' + rgb[i:i + 6] for i in range(0, len(rgb), 6))
+
+# Preset color themes offered in the dialog
+PRESET_COLOR_MAPS = ["Dark2", "Set1", "Set2", "Paired", "tab10", "tab20", "Pastel1"]
+
+# Colors are sampled from at least 8 entries, so charts with up to 8 phases
+# (the common case) switch presets with a dict lookup
+_PRESET_HEX = {name: _get_cmap_hex_list(name, 8) for name in PRESET_COLOR_MAPS}
+
+@functools.lru_cache(maxsize=256)
+def _text_color_for_bg(color: str) -> str:
+    """
+    Pick a readable text color for the given background color.
+    
+    Args:
+        color: Background color in hex format
+        
+    Returns:
+        'white' for dark backgrounds, 'black' for light ones
+    """
+    r, g, b = mcolors.hex2color(color)
+    brightness = (r * 299 + g * 587 + b * 114) / 1000
+    return 'white' if brightness < 0.6 else 'black'
 
 class ColorSelector:
     """
@@ -19,6 +72,10 @@ class ColorSelector:
     Supports saving and loading custom color themes.
     """
     
+    # Parsed themes file shared by all dialogs, and the file's mtime when read
+    _themes_cache: Optional[Dict[str, Dict[str, Any]]] = None
+    _themes_mtime: Optional[float] = None
+    
     def __init__(self, parent: tk.Tk, phases: List[str], initial_colors: Optional[Dict[str, str]] = None, 
                  initial_background: Optional[str] = None, initial_grid: Optional[str] = None):
         """
@@ -38,6 +95,9 @@ class ColorSelector:
         self.grid_color = initial_grid or "#ffffff"  # Default white grid
         self.result = None
         self.saved_themes = self.load_saved_themes()
+        self._sorted_theme_names = sorted(self.saved_themes)  # Kept sorted on insert/delete
+        self._preview_dirty = False  # A preview refresh is pending on after_idle
+        self._bg_preview_dirty = False
         
         # Create dialog window as a proper modal dialog
         self.dialog = tk.Toplevel(parent)
@@ -80,7 +140,7 @@ class ColorSelector:
         ttk.Label(theme_frame, text="Preset Color Themes:").grid(row=0, column=0, sticky=tk.W)
         
         # Get color maps
-        self.color_maps = ["Dark2", "Set1", "Set2", "Paired", "tab10", "tab20", "Pastel1"]
+        self.color_maps = PRESET_COLOR_MAPS
         self.theme_var = tk.StringVar(value="Dark2")
         
         theme_combo = ttk.Combobox(theme_frame, textvariable=self.theme_var, values=self.color_maps)
@@ -94,9 +154,11 @@ class ColorSelector:
         preview_frame = ttk.LabelFrame(phases_frame, text="Preview", padding="10")
         preview_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        self.fig, self.ax = plt.subplots(figsize=(5, 2), tight_layout=True)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=preview_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # A row of colored bars needs no plotting library; draw it natively
+        self._preview_canvas = tk.Canvas(preview_frame, width=360, height=144, 
+                                         bg="white", highlightthickness=0)
+        self._preview_canvas.pack(fill=tk.BOTH, expand=True)
+        self._build_preview()
         
         # Color selector for each phase
         color_frame = ttk.LabelFrame(phases_frame, text="Custom Colors", padding="10")
@@ -124,8 +186,10 @@ class ColorSelector:
         else:
             target_frame = color_frame
         
-        # Create color entry for each phase
+        # Create color entry for each phase. All swatches share one click
+        # handler, which looks the phase up from the clicked widget
         self.color_entries = {}
+        self._swatch_phases = {}
         for i, phase in enumerate(self.phases):
             ttk.Label(target_frame, text=f"{phase}:").grid(row=i, column=0, sticky=tk.W, pady=2)
             
@@ -135,10 +199,11 @@ class ColorSelector:
             color_display.grid(row=i, column=1, padx=10, pady=2)
             # Ensure the frame maintains its size
             color_display.grid_propagate(False)
-            color_display.bind("<Button-1>", lambda e, p=phase: self.choose_color(p))
+            color_display.bind("<Button-1>", self._color_click_handler)
             
             # Store reference
             self.color_entries[phase] = color_display
+            self._swatch_phases[str(color_display)] = phase
         
         # ====== Background Tab ======
         bg_settings_frame = ttk.Frame(background_frame)
@@ -184,9 +249,18 @@ class ColorSelector:
         bg_preview_frame = ttk.LabelFrame(background_frame, text="Background Preview", padding="10")
         bg_preview_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        self.bg_fig, self.bg_ax = plt.subplots(figsize=(5, 3), tight_layout=True)
-        self.bg_canvas = FigureCanvasTkAgg(self.bg_fig, master=bg_preview_frame)
-        self.bg_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # One figure and canvas serve both the Background and the Saved Themes
+        # previews; the canvas is moved to whichever of the two tabs is shown
+        self.bg_fig, self.bg_ax = plt.subplots(figsize=(5, 3), dpi=PREVIEW_DPI)
+        self.bg_canvas = FigureCanvasTkAgg(self.bg_fig, master=notebook)
+        self._bg_preview_frame = bg_preview_frame
+        self._theme_preview_frame = None
+        self.theme_preview_ax = None
+        self._preview_tab = 1
+        self.bg_canvas.get_tk_widget().pack(in_=bg_preview_frame, fill=tk.BOTH, expand=True)
+        self._build_bg_preview()
+        self.bg_fig.tight_layout()
+        self.bg_canvas.mpl_connect('resize_event', lambda event: self.bg_fig.tight_layout())
         
         # Save current theme button - moved to its own frame at the bottom for better visibility
         save_theme_frame = ttk.Frame(background_frame)
@@ -197,12 +271,83 @@ class ColorSelector:
         save_theme_btn.pack(pady=5)
         
         # ====== Saved Themes Tab ======
-        saved_themes_label = ttk.Label(saved_themes_frame, 
+        # Built the first time the tab is shown; many dialogs never visit it
+        self._saved_themes_frame = saved_themes_frame
+        self.themes_listbox = None
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Buttons at bottom for all tabs
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, expand=False, pady=(10, 10))  # Added padding at bottom
+        
+        cancel_btn = ttk.Button(button_frame, text="Cancel", command=self.cancel)
+        cancel_btn.pack(side=tk.RIGHT, padx=5)
+        
+        ok_btn = ttk.Button(button_frame, text="OK", command=self.ok)
+        ok_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Optional DPI awareness adjustment
+        self.dialog.update_idletasks()  # Force layout update
+        min_height = button_frame.winfo_reqheight() + main_frame.winfo_reqheight() + 50
+        self.dialog.minsize(550, min_height)  # Set minimum size based on content
+        
+        # Initialize phase colors
+        if not self.color_map:
+            self.apply_theme()
+        else:
+            self.update_preview()
+            
+        # Initialize background preview
+        self.update_bg_preview()
+    
+    def _on_tab_changed(self, event) -> None:
+        """
+        Build the Saved Themes tab the first time it is selected and move the
+        shared preview canvas to the selected tab.
+        
+        Args:
+            event: Notebook tab change event
+        """
+        index = event.widget.index('current')
+        if index == 2 and self.themes_listbox is None:
+            self._build_saved_themes_tab()
+        if index in (1, 2):
+            self._render_for_tab(index)
+    
+    def _render_for_tab(self, index: int) -> None:
+        """
+        Show the shared preview canvas on a tab and draw that tab's preview.
+        
+        Args:
+            index: Notebook index of the Background (1) or Saved Themes (2) tab
+        """
+        self._preview_tab = index
+        frame = self._bg_preview_frame if index == 1 else self._theme_preview_frame
+        
+        # Re-pack the canvas into the tab; it must be raised above the tab
+        # frames to be visible there, since it is not their child
+        widget = self.bg_canvas.get_tk_widget()
+        widget.pack_forget()
+        widget.pack(in_=frame, fill=tk.BOTH, expand=True)
+        widget.lift()
+        
+        self.bg_ax.set_visible(index == 1)
+        if self.theme_preview_ax is not None:  # Created with the Saved Themes tab
+            self.theme_preview_ax.set_visible(index == 2)
+        self.bg_fig.tight_layout()
+        if index == 1:
+            self.update_bg_preview()
+        else:
+            self.preview_selected_theme(None)
+    
+    def _build_saved_themes_tab(self) -> None:
+        """Create the widgets and preview chart of the Saved Themes tab."""
+        saved_themes_label = ttk.Label(self._saved_themes_frame, 
                                      text="Select a saved theme to apply")
         saved_themes_label.pack(pady=(0, 10), anchor=tk.W)
         
         # Theme selection frame
-        themes_list_frame = ttk.Frame(saved_themes_frame)
+        themes_list_frame = ttk.Frame(self._saved_themes_frame)
         themes_list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # Create listbox with scrollbar
@@ -221,7 +366,7 @@ class ColorSelector:
         self.populate_themes_listbox()
         
         # Buttons for saved themes
-        themes_btn_frame = ttk.Frame(saved_themes_frame)
+        themes_btn_frame = ttk.Frame(self._saved_themes_frame)
         themes_btn_frame.pack(fill=tk.X, pady=10)
         
         apply_theme_btn = ttk.Button(themes_btn_frame, text="Apply Selected Theme", 
@@ -233,57 +378,49 @@ class ColorSelector:
         delete_theme_btn.pack(side=tk.LEFT, padx=5)
         
         # Theme preview frame
-        theme_preview_frame = ttk.LabelFrame(saved_themes_frame, text="Theme Preview")
-        theme_preview_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        self.theme_preview_fig, self.theme_preview_ax = plt.subplots(figsize=(5, 3), tight_layout=True)
-        self.theme_preview_canvas = FigureCanvasTkAgg(self.theme_preview_fig, master=theme_preview_frame)
-        self.theme_preview_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._theme_preview_frame = ttk.LabelFrame(self._saved_themes_frame, text="Theme Preview")
+        self._theme_preview_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        # Drawn on the shared preview canvas, in an axes of its own
+        self.theme_preview_fig = self.bg_fig
+        self.theme_preview_canvas = self.bg_canvas
+        self.theme_preview_ax = self.bg_fig.add_subplot(1, 1, 1)
+        self.theme_preview_ax.set_visible(False)
+        self._build_theme_preview()
+        
+        # Rendered previews of recently viewed themes, dropped on resize
+        self._theme_preview_cache = OrderedDict()
+        self.theme_preview_canvas.mpl_connect(
+            'resize_event', lambda event: self._theme_preview_cache.clear()
+        )
         
         # Listen for theme selection changes
         self.themes_listbox.bind('<<ListboxSelect>>', self.preview_selected_theme)
-        
-        # Buttons at bottom for all tabs
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, expand=False, pady=(10, 10))  # Added padding at bottom
-        
-        cancel_btn = ttk.Button(button_frame, text="Cancel", command=self.cancel)
-        cancel_btn.pack(side=tk.RIGHT, padx=5)
-        
-        ok_btn = ttk.Button(button_frame, text="OK", command=self.ok)
-        ok_btn.pack(side=tk.RIGHT, padx=5)
-        
-        # Optional DPI awareness adjustment
-        self.dialog.update_idletasks()  # Force layout update
-        min_height = button_frame.winfo_reqheight() + main_frame.winfo_reqheight() + 50
-        self.dialog.minsize(550, min_height)  # Set minimum size based on content
-        
-        # Initialize phase colors
-        if not self.color_map:
-            self.apply_theme()
-        else:
-            self.update_preview()
-            
-        # Initialize background preview
-        self.update_bg_preview()
     
     def load_saved_themes(self) -> Dict[str, Dict[str, Any]]:
         """
         Load saved themes from the themes JSON file.
         
+        The parsed file is kept for the session and only re-read when its
+        modification time changes.
+        
         Returns:
             Dictionary of theme names mapped to their settings
         """
         try:
             themes_path = self.get_themes_path()
             
-            if not os.path.exists(themes_path):
+            try:
+                mtime = os.path.getmtime(themes_path)
+            except FileNotFoundError:
                 return {}
-                
-            with open(themes_path, 'r') as f:
-                themes = json.load(f)
             
-            return themes
+            if ColorSelector._themes_cache is None or ColorSelector._themes_mtime != mtime:
+                with open(themes_path, 'r') as f:
+                    ColorSelector._themes_cache = json.load(f)
+                ColorSelector._themes_mtime = mtime
+            
+            return dict(ColorSelector._themes_cache)
         except Exception as e:
             print(f"Error loading saved themes: {e}")
             return {}
@@ -309,7 +446,10 @@ class ColorSelector:
             themes_path = self.get_themes_path()
             
             with open(themes_path, 'w') as f:
-                json.dump(self.saved_themes, f, indent=2)
+                json.dump(self.saved_themes, f, separators=(',', ':'))
+            
+            ColorSelector._themes_cache = dict(self.saved_themes)
+            ColorSelector._themes_mtime = os.path.getmtime(themes_path)
         except Exception as e:
             print(f"Error saving themes: {e}")
     
@@ -317,27 +457,29 @@ class ColorSelector:
         """Populate the themes listbox with saved theme names."""
         self.themes_listbox.delete(0, tk.END)
         
-        # Sort theme names alphabetically
-        theme_names = sorted(self.saved_themes.keys())
-        
-        for theme_name in theme_names:
+        # Theme names are kept in alphabetical order
+        for theme_name in self._sorted_theme_names:
             self.themes_listbox.insert(tk.END, theme_name)
     
+    @contextmanager
+    def _modal_suspend(self):
+        """Release the dialog's grab while a nested dialog is open, then restore it."""
+        self.dialog.grab_release()
+        try:
+            yield
+        finally:
+            self.dialog.grab_set()
+            self.dialog.focus_set()
+    
     def save_current_theme(self) -> None:
         """
         Save the current color settings as a named theme.
         Prompts for confirmation if theme name already exists.
         """
-        # Temporarily release grab for dialog
-        self.dialog.grab_release()
-        
-        theme_name = simpledialog.askstring("Save Theme", 
-                                          "Enter a name for this theme:",
-                                          parent=self.dialog)
-        
-        # Re-establish modal behavior
-        self.dialog.grab_set()
-        self.dialog.focus_set()
+        with self._modal_suspend():
+            theme_name = simpledialog.askstring("Save Theme", 
+                                              "Enter a name for this theme:",
+                                              parent=self.dialog)
         
         if not theme_name:
             return
@@ -345,21 +487,12 @@ class ColorSelector:
         # Check if theme name already exists
         overwrite = True
         if (theme_name in self.saved_themes):
-            # Import here to avoid circular imports
-            from tkinter import messagebox
-            
-            # Release grab for confirmation dialog
-            self.dialog.grab_release()
-            
-            overwrite = messagebox.askyesno(
-                "Theme Already Exists",
-                f"A theme named '{theme_name}' already exists. Do you want to overwrite it?",
-                parent=self.dialog
-            )
-            
-            # Re-establish modal behavior
-            self.dialog.grab_set()
-            self.dialog.focus_set()
+            with self._modal_suspend():
+                overwrite = messagebox.askyesno(
+                    "Theme Already Exists",
+                    f"A theme named '{theme_name}' already exists. Do you want to overwrite it?",
+                    parent=self.dialog
+                )
             
             if not overwrite:
                 return  # User chose not to overwrite, exit without saving
@@ -372,16 +505,26 @@ class ColorSelector:
         }
         
         # Save to themes dictionary
+        is_new_theme = theme_name not in self.saved_themes
+        if is_new_theme:
+            bisect.insort(self._sorted_theme_names, theme_name)
         self.saved_themes[theme_name] = theme_data
+        if self.themes_listbox is not None:
+            self._theme_preview_cache.pop(theme_name, None)
         
         # Save to file
         self.save_themes()
         
-        # Update listbox
-        self.populate_themes_listbox()
+        # The listbox picks the theme up when the Saved Themes tab is first built
+        if self.themes_listbox is None:
+            return
+        
+        # Add a new theme to the listbox at its sorted position
+        idx = bisect.bisect_left(self._sorted_theme_names, theme_name)
+        if is_new_theme:
+            self.themes_listbox.insert(idx, theme_name)
         
         # Select the new theme
-        idx = sorted(self.saved_themes.keys()).index(theme_name)
         self.themes_listbox.selection_clear(0, tk.END)
         self.themes_listbox.selection_set(idx)
         self.themes_listbox.see(idx)
@@ -406,10 +549,12 @@ class ColorSelector:
         self.background_color = theme_data.get('background_color', "#1f2937")
         self.grid_color = theme_data.get('grid_color', "#ffffff")
         
-        # Update UI elements
-        for phase, color in self.color_map.items():
-            if phase in self.color_entries:
-                self.color_entries[phase].configure(bg=color)
+        # Update UI elements; call Tk directly to skip configure()'s option
+        # dict handling for each swatch
+        color_map = self.color_map
+        for phase in [p for p in self.color_entries if p in color_map]:
+            widget = self.color_entries[phase]
+            widget.tk.call(widget._w, 'configure', '-bg', color_map[phase])
         
         self.bg_preview.configure(bg=self.background_color)
         self.grid_preview.configure(bg=self.grid_color)
@@ -426,18 +571,12 @@ class ColorSelector:
             
         theme_name = self.themes_listbox.get(selection[0])
         
-        # Temporarily release grab for dialog
-        self.dialog.grab_release()
-        
-        confirm = messagebox.askyesno(
-            "Confirm Delete",
-            f"Are you sure you want to delete the theme '{theme_name}'?",
-            parent=self.dialog
-        )
-        
-        # Re-establish modal behavior
-        self.dialog.grab_set()
-        self.dialog.focus_set()
+        with self._modal_suspend():
+            confirm = messagebox.askyesno(
+                "Confirm Delete",
+                f"Are you sure you want to delete the theme '{theme_name}'?",
+                parent=self.dialog
+            )
         
         if not confirm:
             return
@@ -445,12 +584,14 @@ class ColorSelector:
         # Remove theme
         if theme_name in self.saved_themes:
             del self.saved_themes[theme_name]
+            self._sorted_theme_names.remove(theme_name)
+            self._theme_preview_cache.pop(theme_name, None)
             
         # Save to file
         self.save_themes()
         
         # Update listbox
-        self.populate_themes_listbox()
+        self.themes_listbox.delete(selection[0])
         
         # Clear theme preview
         self.clear_theme_preview()
@@ -473,78 +614,116 @@ class ColorSelector:
         if not theme_data:
             self.clear_theme_preview()
             return
-            
-        # Update theme preview
-        self.update_theme_preview(theme_data)
+        
+        if self._preview_tab != 2:
+            self.update_theme_preview(theme_data)
+            return
+        
+        # Artists are always updated so later full redraws stay correct, but a
+        # theme that was rendered recently is shown by restoring its pixels
+        self.update_theme_preview(theme_data, draw=False)
+        cached = self._theme_preview_cache.get(theme_name)
+        if cached is not None:
+            self._theme_preview_cache.move_to_end(theme_name)
+            self.theme_preview_canvas.restore_region(cached)
+            self.theme_preview_canvas.blit()
+            return
+        
+        # Render synchronously so the result can be cached
+        self.theme_preview_canvas.draw()
+        self._theme_preview_cache[theme_name] = self.theme_preview_canvas.copy_from_bbox(
+            self.theme_preview_fig.bbox
+        )
+        if len(self._theme_preview_cache) > THEME_PREVIEW_CACHE_SIZE:
+            self._theme_preview_cache.popitem(last=False)
+    
+    def _build_theme_preview(self) -> None:
+        """
+        Create the sample chart shown in the theme preview.
+        
+        The artists are created once; update_theme_preview only recolors them.
+        """
+        ax = self.theme_preview_ax
+        
+        # Create a simple preview chart
+        labels = ["Task A", "Task B", "Task C", "Task D"]
+        self._theme_preview_phases = ["Phase 1", "Phase 1", "Phase 2", "Phase 2"]
+        
+        # Sample tasks with different durations
+        durations = [10, 8, 12, 6]
+        starts = [1, 3, 6, 8]
+        
+        # Plot tasks in reverse order so the earliest task is at the top
+        y_positions = range(len(labels) - 1, -1, -1)
+        self._theme_preview_bars = ax.barh(y_positions, durations, left=starts, height=0.5, 
+                                           edgecolor='black')
+        
+        ax.set_yticks(range(len(labels)))
+        ax.set_yticklabels(reversed(labels))
+        ax.grid(True, axis='x', alpha=0.3)
+        
+        # Start out empty until a theme is selected
+        self.clear_theme_preview()
     
-    def update_theme_preview(self, theme_data: Dict[str, Any]) -> None:
+    def update_theme_preview(self, theme_data: Dict[str, Any], draw: bool = True) -> None:
         """
         Update the theme preview with the specified theme data.
         
         Args:
             theme_data: Theme data containing colors and settings
+            draw: Whether to schedule a redraw of the preview
         """
-        self.theme_preview_ax.clear()
+        ax = self.theme_preview_ax
         
         # Get colors from theme
         bg_color = theme_data.get('background_color', "#1f2937")
         grid_color = theme_data.get('grid_color', "#ffffff")
         phase_colors = theme_data.get('phase_colors', {})
         
-        # Set background color
-        self.theme_preview_fig.patch.set_facecolor(bg_color)
-        self.theme_preview_ax.set_facecolor(bg_color)
+        # Set background color (the figure is shared, so only while it is shown)
+        if self._preview_tab == 2:
+            self.theme_preview_fig.patch.set_facecolor(bg_color)
+        ax.set_facecolor(bg_color)
         
-        # Calculate text color based on background
-        r, g, b = mcolors.hex2color(bg_color)
-        brightness = (r * 299 + g * 587 + b * 114) / 1000
-        text_color = 'white' if brightness < 0.6 else 'black'
-        
-        # Create a simple preview chart
-        labels = ["Task A", "Task B", "Task C", "Task D"]
-        phases = ["Phase 1", "Phase 1", "Phase 2", "Phase 2"]
+        # Showing the axes changes the layout (ticks and labels need room)
+        relayout = not ax.axison
+        ax.set_axis_on()
         
-        # Sample tasks with different durations
-        durations = [10, 8, 12, 6]
-        starts = [1, 3, 6, 8]
+        # Calculate text color based on background
+        text_color = _text_color_for_bg(bg_color)
         
-        # Plot tasks in reverse order for top-to-bottom layout
-        for i, (label, start, duration, phase) in enumerate(
-            zip(labels, starts, durations, phases)
-        ):
-            # Calculate position so earliest tasks are at the top
-            y_pos = len(labels) - 1 - i
-            
-            # Get color for this phase
-            if phase in phase_colors:
-                color = phase_colors[phase]
-            else:
-                # Fallback to default color if phase not in theme
-                color = plt.cm.Dark2(i % 8)
-            
-            self.theme_preview_ax.barh(y_pos, duration, left=start, height=0.5, 
-                                      color=color, edgecolor='black')
+        for i, (bar, phase) in enumerate(zip(self._theme_preview_bars, self._theme_preview_phases)):
+            # Fallback to default color if phase not in theme
+            bar.set_facecolor(phase_colors.get(phase, plt.cm.Dark2(i % 8)))
+            bar.set_visible(True)
         
-        # Add grid lines in theme grid color
-        self.theme_preview_ax.grid(True, axis='x', alpha=0.3, color=grid_color)
+        # Grid lines in theme grid color
+        ax.grid(True, axis='x', alpha=0.3, color=grid_color)
         
         # Style axis elements with text color
-        self.theme_preview_ax.set_yticks(range(len(labels)))
-        self.theme_preview_ax.set_yticklabels(reversed(labels), color=text_color)
-        self.theme_preview_ax.tick_params(colors=text_color)
-        
-        for spine in self.theme_preview_ax.spines.values():
+        ax.tick_params(colors=text_color)
+        for spine in ax.spines.values():
             spine.set_color(grid_color)
         
-        self.theme_preview_ax.set_title("Theme Preview", color=text_color)
+        ax.set_title("Theme Preview", color=text_color)
         
-        self.theme_preview_canvas.draw()
+        if relayout and self._preview_tab == 2:
+            self.theme_preview_fig.tight_layout()
+        if draw and self._preview_tab == 2:
+            self.theme_preview_canvas.draw_idle()
     
     def clear_theme_preview(self) -> None:
         """Clear the theme preview area."""
-        self.theme_preview_ax.clear()
-        self.theme_preview_ax.set_title("No theme selected")
-        self.theme_preview_canvas.draw()
+        for bar in self._theme_preview_bars:
+            bar.set_visible(False)
+        relayout = self.theme_preview_ax.axison
+        self.theme_preview_ax.set_axis_off()
+        self.theme_preview_ax.set_title("No theme selected", color=plt.rcParams['text.color'])
+        if self._preview_tab == 2:
+            if relayout:
+                self.theme_preview_fig.tight_layout()
+            self.theme_preview_fig.patch.set_facecolor(plt.rcParams['figure.facecolor'])
+            self.theme_preview_canvas.draw_idle()
     
     def center_on_parent(self) -> None:
         """Center the dialog window on its parent."""
@@ -574,21 +753,30 @@ class ColorSelector:
             event: Optional event data when triggered by combobox selection
         """
         theme = self.theme_var.get()
-        cmap = plt.cm.get_cmap(theme, max(len(self.phases), 8))
+        n = max(len(self.phases), 8)
+        hex_list = _PRESET_HEX.get(theme) if n == 8 else None
+        if hex_list is None:
+            hex_list = _get_cmap_hex_list(theme, n)
         
         # Apply colors from the theme
         for i, phase in enumerate(self.phases):
-            rgba = cmap(i % cmap.N)
-            hex_color = '#{:02x}{:02x}{:02x}'.format(
-                int(rgba[0] * 255), 
-                int(rgba[1] * 255), 
-                int(rgba[2] * 255)
-            )
+            hex_color = hex_list[i % len(hex_list)]
             self.color_map[phase] = hex_color
             self.color_entries[phase].configure(bg=hex_color)
         
         self.update_preview()
     
+    def _color_click_handler(self, event) -> None:
+        """
+        Open the color chooser for the phase whose swatch was clicked.
+        
+        Args:
+            event: Click event on a phase color swatch
+        """
+        phase = self._swatch_phases.get(str(event.widget))
+        if phase is not None:
+            self.choose_color(phase)
+    
     def choose_color(self, phase: str) -> None:
         """
         Open color chooser for a specific phase.
@@ -598,19 +786,13 @@ class ColorSelector:
         """
         current_color = self.color_map.get(phase, "#cccccc")
         
-        # Temporarily release grab so colorchooser dialog works properly
-        self.dialog.grab_release()
-        
-        # Use the imported colorchooser directly
-        color = colorchooser.askcolor(
-            color=current_color,
-            title=f"Select Color for {phase}",
-            parent=self.dialog  # Set parent to ensure proper modal behavior
-        )
-        
-        # Re-establish modal behavior
-        self.dialog.grab_set()
-        self.dialog.focus_set()
+        with self._modal_suspend():
+            # Use the imported colorchooser directly
+            color = colorchooser.askcolor(
+                color=current_color,
+                title=f"Select Color for {phase}",
+                parent=self.dialog  # Set parent to ensure proper modal behavior
+            )
         
         if color[1]:  # If color is selected (not canceled)
             self.color_map[phase] = color[1]
@@ -619,18 +801,12 @@ class ColorSelector:
     
     def choose_background_color(self) -> None:
         """Open color chooser for chart background."""
-        # Temporarily release grab
-        self.dialog.grab_release()
-        
-        color = colorchooser.askcolor(
-            color=self.background_color,
-            title="Select Chart Background Color",
-            parent=self.dialog
-        )
-        
-        # Re-establish modal behavior
-        self.dialog.grab_set()
-        self.dialog.focus_set()
+        with self._modal_suspend():
+            color = colorchooser.askcolor(
+                color=self.background_color,
+                title="Select Chart Background Color",
+                parent=self.dialog
+            )
         
         if color[1]:
             self.background_color = color[1]
@@ -639,18 +815,12 @@ class ColorSelector:
     
     def choose_grid_color(self) -> None:
         """Open color chooser for grid lines."""
-        # Temporarily release grab
-        self.dialog.grab_release()
-        
-        color = colorchooser.askcolor(
-            color=self.grid_color,
-            title="Select Grid Lines Color",
-            parent=self.dialog
-        )
-        
-        # Re-establish modal behavior
-        self.dialog.grab_set()
-        self.dialog.focus_set()
+        with self._modal_suspend():
+            color = colorchooser.askcolor(
+                color=self.grid_color,
+                title="Select Grid Lines Color",
+                parent=self.dialog
+            )
         
         if color[1]:
             self.grid_color = color[1]
@@ -671,81 +841,126 @@ class ColorSelector:
         self.grid_preview.configure(bg=grid_color)
         self.update_bg_preview()
     
-    def update_preview(self) -> None:
-        """Update the phase colors preview chart."""
-        self.ax.clear()
+    def _build_preview(self) -> None:
+        """
+        Create one bar and label per phase for the phase colors preview.
         
-        # Create a simple bar chart as preview
-        y_pos = range(len(self.phases))
+        The canvas items are created once; update_preview only recolors them
+        and _layout_preview positions them whenever the canvas is resized.
+        """
+        canvas = self._preview_canvas
+        self._preview_title_id = canvas.create_text(0, 0, text="Phase Colors Preview", 
+                                                    anchor=tk.N, font=("Arial", 11))
+        self._phase_rect_ids = [
+            canvas.create_rectangle(0, 0, 0, 0, outline="black") for _ in self.phases
+        ]
+        self._phase_text_ids = [
+            canvas.create_text(0, 0, text=phase, font=("Arial", 9, "bold")) 
+            for phase in self.phases
+        ]
+        canvas.bind("<Configure>", self._layout_preview)
+    
+    def _layout_preview(self, event) -> None:
+        """
+        Position the phase colors preview items for the current canvas size.
         
-        for i, phase in enumerate(self.phases):
+        Args:
+            event: Configure event of the preview canvas
+        """
+        canvas = self._preview_canvas
+        margin = 6
+        title_height = 22
+        canvas.coords(self._preview_title_id, event.width / 2, margin)
+        
+        # One row per phase, first phase at the bottom; bars fill 70% of a row
+        row_height = (event.height - title_height - 2 * margin) / max(len(self.phases), 1)
+        for i, (rect_id, text_id) in enumerate(zip(self._phase_rect_ids, self._phase_text_ids)):
+            y_center = event.height - margin - (i + 0.5) * row_height
+            half_bar = 0.35 * row_height
+            canvas.coords(rect_id, margin, y_center - half_bar, 
+                          event.width - margin, y_center + half_bar)
+            canvas.coords(text_id, event.width / 2, y_center)
+    
+    def update_preview(self) -> None:
+        """Schedule a refresh of the phase colors preview chart."""
+        # Several changes in one event (e.g. applying a saved theme) share
+        # a single refresh once Tk is idle
+        if not self._preview_dirty:
+            self._preview_dirty = True
+            self.dialog.after_idle(self._do_update_preview)
+    
+    def _do_update_preview(self) -> None:
+        """Update the phase colors preview chart."""
+        self._preview_dirty = False
+        if not self.dialog.winfo_exists():
+            return
+        canvas = self._preview_canvas
+        for rect_id, text_id, phase in zip(self._phase_rect_ids, self._phase_text_ids, self.phases):
             color = self.color_map.get(phase, "#cccccc")
-            self.ax.barh(i, 1, color=color, height=0.7, edgecolor='black')
+            canvas.itemconfigure(rect_id, fill=color)
             
             # Determine text color based on background brightness for better visibility
-            r, g, b = mcolors.hex2color(color)
-            brightness = (r * 299 + g * 587 + b * 114) / 1000
-            text_color = 'white' if brightness < 0.6 else 'black'
-            
-            self.ax.text(0.5, i, phase, ha='center', va='center', 
-                        color=text_color, fontweight='bold')
-        
-        self.ax.set_yticks([])
-        self.ax.set_xticks([])
-        self.ax.set_xlim(0, 1)
-        self.ax.set_title("Phase Colors Preview")
-        
-        self.canvas.draw()
+            canvas.itemconfigure(text_id, fill=_text_color_for_bg(color))
     
-    def update_bg_preview(self) -> None:
+    def _build_bg_preview(self) -> None:
         """
-        Update the background preview chart with tasks displayed from top-left to bottom-right.
+        Create the sample Gantt chart shown in the background preview.
         
-        This method creates a sample Gantt chart in the background preview panel
-        with proper task ordering.
+        Tasks are displayed from top-left to bottom-right. The artists are
+        created once; update_bg_preview only recolors them.
         """
-        self.bg_ax.clear()
-        
-        # Set background color
-        self.bg_fig.patch.set_facecolor(self.background_color)
-        self.bg_ax.set_facecolor(self.background_color)
-        
         # Create a sample Gantt chart
         labels = ["Task 1", "Task 2", "Task 3", "Task 4", "Task 5"]
         
-        # Calculate text color based on background
-        r, g, b = mcolors.hex2color(self.background_color)
-        brightness = (r * 299 + g * 587 + b * 114) / 1000
-        text_color = 'white' if brightness < 0.6 else 'black'
-        
         # Sample tasks with different durations and start dates
         # These are arranged so that earlier tasks appear at the top
         durations = [10, 8, 12, 6, 9]
         starts = [1, 3, 6, 8, 12]
         
         # Plot tasks in reverse order to get the earliest task at the top
-        for i, (label, start, duration) in enumerate(zip(labels, starts, durations)):
-            # Calculate y-position so earliest tasks are at the top
-            y_pos = len(labels) - 1 - i
-            
-            self.bg_ax.barh(y_pos, duration, left=start, height=0.5, 
-                           color=plt.cm.Dark2(i % 8), edgecolor='black')
+        y_positions = range(len(labels) - 1, -1, -1)
+        colors = [plt.cm.Dark2(i % 8) for i in range(len(labels))]
+        self.bg_ax.barh(y_positions, durations, left=starts, height=0.5, 
+                        color=colors, edgecolor='black')
+        
+        self.bg_ax.set_yticks(range(len(labels)))
+        self.bg_ax.set_yticklabels(reversed(labels))  # Use reversed labels
+        self.bg_ax.set_title("Background Preview")
+        self.bg_ax.set_xlabel("Timeline")
+    
+    def update_bg_preview(self) -> None:
+        """Schedule a refresh of the background preview chart."""
+        if not self._bg_preview_dirty:
+            self._bg_preview_dirty = True
+            self.dialog.after_idle(self._do_update_bg_preview)
+    
+    def _do_update_bg_preview(self) -> None:
+        """Update the background preview chart with the current colors."""
+        self._bg_preview_dirty = False
+        if not self.dialog.winfo_exists():
+            return
+        # Set background color (the figure is shared, so only while it is shown)
+        if self._preview_tab == 1:
+            self.bg_fig.patch.set_facecolor(self.background_color)
+        self.bg_ax.set_facecolor(self.background_color)
+        
+        # Calculate text color based on background
+        text_color = _text_color_for_bg(self.background_color)
         
         # Add grid lines in selected color
         self.bg_ax.grid(True, axis='x', alpha=0.3, color=self.grid_color)
         
         # Style axis elements with our text color
-        self.bg_ax.set_yticks(range(len(labels)))
-        self.bg_ax.set_yticklabels(reversed(labels), color=text_color)  # Use reversed labels
         self.bg_ax.tick_params(colors=text_color)
         
         for spine in self.bg_ax.spines.values():
             spine.set_color(self.grid_color)
         
-        self.bg_ax.set_title("Background Preview", color=text_color)
-        self.bg_ax.set_xlabel("Timeline", color=text_color)
+        self.bg_ax.title.set_color(text_color)
+        self.bg_ax.xaxis.label.set_color(text_color)
         
-        self.bg_canvas.draw()
+        if self._preview_tab == 1:
+            self.bg_canvas.draw_idle()
     
     def ok(self) -> None:
         """Save the color selections and close the dialog."""
@@ -780,9 +995,6 @@ def select_colors(parent: tk.Tk, phases: List[str],
         Dictionary with 'phase_colors', 'background_color', and 'grid_color' keys,
         or None if canceled
     """
-    # Import here to avoid circular imports
-    from tkinter import messagebox
-    
     selector = ColorSelector(
         parent, 
         phases, 
@@ -2,32 +2,102 @@
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 
-import pandas as pd
-from matplotlib import pyplot as plt
 import tkinter as tk
 from tkinter import filedialog
-import numpy as np
 import re
-import matplotlib.dates as mdates
-import matplotlib.font_manager as fm
+import os
+import io
+import hashlib
+import functools
+
+from chart_engine import load_cache_entry, store_cache_entry
+
+# pandas, numpy, openpyxl and pyplot take a noticeable time to import, so they
+# are only loaded once a file has been chosen and is being processed
+_LAZY_NAMES = (
+    'pd', 'np', 'openpyxl', 'plt', 'mdates', 'mtransforms', 'PolyCollection', 'Patch', 'Text',
+    'LABEL_FONT'
+)
+
+@functools.lru_cache(maxsize=1)
+def _load_libraries():
+    """Import the data and plotting libraries into the module namespace."""
+    import pandas as pd
+    import numpy as np
+    import openpyxl
+    from matplotlib import pyplot as plt
+    import matplotlib.dates as mdates
+    import matplotlib.transforms as mtransforms
+    from matplotlib.collections import PolyCollection
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.patches import Patch
+    from matplotlib.text import Text
+    globals().update(
+        pd=pd, np=np, openpyxl=openpyxl, plt=plt, mdates=mdates, mtransforms=mtransforms,
+        PolyCollection=PolyCollection, Patch=Patch, Text=Text,
+        # Font shared by every duration label
+        LABEL_FONT=FontProperties(family='Arial', weight='bold', size=9)
+    )
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _load_libraries()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Add debug printing
 DEBUG = True
 
-def debug_print(message):
-    if DEBUG:
+# Resolved once at import; with DEBUG off (or under python -O) debug_print is a no-op.
+# Calls that format their message are also wrapped in `if DEBUG:` so the f-string
+# is never built when debugging is off
+if __debug__ and DEBUG:
+    def debug_print(message):
         print(f"DEBUG [MAIN]: {message}")
+else:
+    def debug_print(message):
+        pass
 
 # At the start of the file
 debug_print("Importing main.py")
-debug_print(f"Using matplotlib backend: {matplotlib.get_backend()}")
+if DEBUG:
+    debug_print(f"Using matplotlib backend: {matplotlib.get_backend()}")
+
+# Required columns with their case-insensitive fallback patterns, compiled once
+REQUIRED_COLUMN_PATTERNS = (
+    ('Task', re.compile(r'^task$', re.IGNORECASE)),
+    ('Duration_Weeks', re.compile(r'duration.*weeks', re.IGNORECASE)),
+    ('Phase', re.compile(r'^phase$', re.IGNORECASE)),
+    ('Start_Date', re.compile(r'start.*date', re.IGNORECASE)),
+    ('End_Date', re.compile(r'end.*date', re.IGNORECASE))
+)
+
+# Arial with white text, ticks and spines on a dark navy background for every
+# chart artist. Applied with rc_context so artists pick the style up when they
+# are created
+CHART_RC = {
+    'figure.facecolor': '#1a1a44',
+    'axes.facecolor': '#1a1a44',
+    'legend.facecolor': 'white',  # Otherwise the legend inherits the axes color
+    'font.family': 'Arial',
+    'text.color': 'white',
+    'axes.edgecolor': 'white',
+    'axes.labelcolor': 'white',
+    'xtick.color': 'white',
+    'ytick.color': 'white'
+}
+
+# Version of the QUICKGANTT_CACHE entries, which live in chart_engine's
+# cache directory; bump it when reading or column matching changes
+CACHE_VERSION = 2
+
+# Workbooks above this size are streamed when calamine is not installed
+STREAM_THRESHOLD_BYTES = 10 << 20
 
 def main(root_window=None):
     """Main function that generates a Gantt chart from Excel data"""
-    debug_print(f"main() called with root_window={root_window}")
-    
-    # Set the default font family to Arial
-    plt.rcParams['font.family'] = 'Arial'
+    if DEBUG:
+        debug_print(f"main() called with root_window={root_window}")
     
     debug_print("Using filedialog to get file path")
     # Ask user to select an Excel file using the provided root window
@@ -36,7 +106,8 @@ def main(root_window=None):
         title="Select Excel File",
         filetypes=[("Excel files", "*.xlsx;*.xls")]
     )
-    debug_print(f"File path selected: {file_path}")
+    if DEBUG:
+        debug_print(f"File path selected: {file_path}")
     
     # Check if a file was selected
     if not file_path:
@@ -54,42 +125,40 @@ def main(root_window=None):
         print(f"An error occurred: {e}")
         raise
 
-def process_excel_file(file_path):
-    debug_print("Start processing Excel file")
-    # Read the Excel file
-    df = pd.read_excel(file_path)
+def read_task_data(file_path):
+    """Read the task columns from an Excel file.
+    
+    Returns the DataFrame and the mapping of standard column names to the
+    file's column names, or None if any required column is missing.
+    """
+    _load_libraries()
+    # Read only the header row first; the full read is limited to the
+    # columns matched below. Prefer the Rust-based calamine engine if installed
+    try:
+        engine = 'calamine'
+        df = pd.read_excel(file_path, engine=engine, nrows=0)
+    except ImportError:
+        engine = None
+        df = pd.read_excel(file_path, nrows=0)
     
     # Print available columns for debugging
     print("Available columns in Excel file:")
     for col in df.columns:
         print(f"  - '{col}'")
     
-    # Define required columns with case-insensitive matching
-    required_column_patterns = {
-        'Task': r'^task$',
-        'Duration_Weeks': r'duration.*weeks',
-        'Phase': r'^phase$',
-        'Start_Date': r'start.*date',
-        'End_Date': r'end.*date'
-    }
-    
     # Create a mapping of actual column names to standard names
     column_mapping = {}
     missing_columns = []
     
-    for std_name, pattern in required_column_patterns.items():
-        matching_cols = []
-        for col in df.columns:
-            # Use a direct equality check if possible
-            if col.replace(' ', '_') == std_name:
-                matching_cols = [col]
-                break
-            # Otherwise try case-insensitive regex pattern matching
-            elif re.search(pattern, col, re.IGNORECASE):
-                matching_cols.append(col)
+    for std_name, pattern in REQUIRED_COLUMN_PATTERNS:
+        # Prefer a direct equality match, otherwise take the first column
+        # matching the case-insensitive regex pattern
+        match = next((col for col in df.columns if col.replace(' ', '_') == std_name), None)
+        if match is None:
+            match = next((col for col in df.columns if pattern.search(col)), None)
         
-        if matching_cols:
-            column_mapping[std_name] = matching_cols[0]
+        if match is not None:
+            column_mapping[std_name] = match
         else:
             missing_columns.append(std_name)
     
@@ -101,97 +170,215 @@ def process_excel_file(file_path):
     if missing_columns:
         print(f"\nError: Missing required columns: {', '.join(missing_columns)}")
         print(f"Available columns: {', '.join(df.columns)}")
-        return
+        return None
+    
+    # Parse just the matched columns, converting the date columns to datetime
+    # during the read. Columns keep the file's names and are looked up
+    # through column_mapping
+    usecols = list(dict.fromkeys(column_mapping.values()))
+    date_cols = list(dict.fromkeys((column_mapping['Start_Date'], column_mapping['End_Date'])))
+    
+    # Without calamine, stream large workbooks to keep memory bounded
+    if (engine is None and file_path.lower().endswith(('.xlsx', '.xlsm')) 
+            and os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES):
+        debug_print("Streaming large workbook with openpyxl")
+        column_positions = {col: df.columns.get_loc(col) for col in usecols}
+        df = stream_excel(file_path, column_positions, date_cols)
+    else:
+        df = pd.read_excel(file_path, engine=engine, usecols=usecols, 
+                           parse_dates=date_cols)
+        # parse_dates leaves a column it cannot fully parse as object dtype;
+        # convert it here so invalid cells raise a clear error
+        for col in date_cols:
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col])
+    return df, column_mapping
+
+def stream_excel(file_path, column_positions, date_cols):
+    """Read selected columns of the first sheet row by row.
+    
+    Only the requested cells are kept, instead of materializing the whole
+    sheet as read_excel does with openpyxl.
+    
+    Args:
+        file_path: Path to an .xlsx/.xlsm file
+        column_positions: Column names mapped to their 0-based sheet positions
+        date_cols: Columns to convert to datetime
+    """
+    _load_libraries()
+    data = {col: [] for col in column_positions}
+    positions = list(column_positions.values())
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        # The first row holds the headers
+        for row in workbook.worksheets[0].iter_rows(min_row=2, values_only=True):
+            values = [row[i] if i < len(row) else None for i in positions]
+            if all(value is None for value in values):
+                continue
+            for column, value in zip(data.values(), values):
+                column.append(value)
+    finally:
+        workbook.close()
+    
+    df = pd.DataFrame(data)
+    for col in date_cols:
+        df[col] = pd.to_datetime(df[col])
+    return df
+
+def read_task_data_cached(file_path):
+    """Read task data through the opt-in parsed-data cache.
+    
+    Entries are kept in chart_engine's cache directory, one per workbook
+    path, and replaced whenever the workbook's contents change.
+    """
+    file_path = os.path.abspath(file_path)
+    with open(file_path, 'rb') as f:
+        content_hash = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    metadata = {'version': CACHE_VERSION, 'source': file_path, 'hash': content_hash}
+    
+    # Use the entry only if it was made from this exact version of the file
+    entry = load_cache_entry('main', file_path, metadata)
+    if entry is not None and isinstance(entry[1].get('column_mapping'), dict):
+        if DEBUG:
+            debug_print(f"Loading cached data for {file_path}")
+        return entry[0], entry[1]['column_mapping']
+    
+    task_data = read_task_data(file_path)
+    if task_data is None:
+        return None
     
-    # Rename columns to standard names for consistency (with underscores instead of spaces)
-    df = df.rename(columns={v: k for k, v in column_mapping.items()})
+    df, column_mapping = task_data
+    store_cache_entry('main', file_path, {**metadata, 'column_mapping': column_mapping}, df)
+    return task_data
+
+@matplotlib.rc_context(CHART_RC)
+def process_excel_file(file_path, return_mode='figure'):
+    """Build the Gantt chart for an Excel file.
+    
+    Args:
+        file_path: Path to the Excel file
+        return_mode: 'figure' returns the live Figure. 'rgba' returns the
+            rendered image as an RGBA ndarray and 'png' returns PNG bytes;
+            both close the figure so its artists are freed right away.
+    
+    Returns None if required columns are missing.
+    """
+    if return_mode not in ('figure', 'rgba', 'png'):
+        raise ValueError(f"Unknown return_mode: {return_mode!r}")
+    debug_print("Start processing Excel file")
+    _load_libraries()
+    
+    # Optionally go through the parsed-data cache, so re-running on an
+    # unchanged file skips Excel parsing
+    if os.environ.get('QUICKGANTT_CACHE') == '1':
+        task_data = read_task_data_cached(file_path)
+    else:
+        task_data = read_task_data(file_path)
+    if task_data is None:
+        return
     
-    # Convert date columns to datetime
-    df['Start_Date'] = pd.to_datetime(df['Start_Date'])
-    df['End_Date'] = pd.to_datetime(df['End_Date'])
+    df, column_mapping = task_data
+    task_col, duration_col, phase_col, start_col, end_col = (
+        column_mapping[std_name] for std_name in 
+        ('Task', 'Duration_Weeks', 'Phase', 'Start_Date', 'End_Date')
+    )
     
     # Define custom colors based on the provided image
     # Using a bright green, teal blue, and purple
     custom_colors = ['#90c144', '#00b2d4', '#9b59b6']
     
-    # Create a color map for phases
-    phases = df['Phase'].unique()
+    # Create a color map for phases, in order of first appearance
+    phases = pd.Index(df[phase_col].unique())
     
     # If there are more phases than colors, cycle through the colors
-    phase_colors = {}
-    for i, phase in enumerate(phases):
-        phase_colors[phase] = custom_colors[i % len(custom_colors)]
-    
-    # Sort by start date first, then phase (earliest dates at the top)
-    df = df.sort_values(['Start_Date', 'Phase'])
+    phase_color_table = np.array(custom_colors)[np.arange(len(phases)) % len(custom_colors)]
+    phase_colors = dict(zip(phases, phase_color_table.tolist()))
+    
+    # Sort by start date first, then phase (earliest dates at the top). Both
+    # keys are turned into integers so one stable np.lexsort call orders the
+    # rows; missing values sort last, as with sort_values
+    start_values = df[start_col].to_numpy()
+    start_key = np.where(np.isnat(start_values), np.iinfo(np.int64).max, 
+                         start_values.view('i8'))
+    phase_key, phase_order = pd.factorize(df[phase_col], sort=True)
+    phase_key[phase_key < 0] = len(phase_order)
+    df = df.iloc[np.lexsort((phase_key, start_key))]
     
     # Create the plot
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    # Create lists for y-ticks and labels
-    y_ticks = []
-    y_labels = []
-    
-    # Plot each task as a horizontal bar with phase-based coloring
-    for i, task in enumerate(df.itertuples()):
-        # Use len(df)-i-1 to invert the y-axis (earliest at top)
-        y_pos = len(df) - i - 1
-        y_ticks.append(y_pos)
-        y_labels.append(task.Task)
-        
-        # Calculate bar width in days
-        bar_width = (task.End_Date - task.Start_Date).days
-        
-        # Plot the bar
-        bar = ax.barh(y_pos, 
-                bar_width, 
-                left=task.Start_Date, 
-                color=phase_colors[task.Phase],
-                height=0.5)
-        
-        # Calculate midpoint of the bar for text placement
-        bar_midpoint = task.Start_Date + pd.Timedelta(days=bar_width/2)
-        
-        # Add the duration weeks as text above the bar
-        ax.text(bar_midpoint, y_pos + 0.25, 
-                f"{task.Duration_Weeks}", 
-                ha='center', va='bottom',
-                fontweight='bold', fontsize=9,
-                family='Arial',
-                bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1))
+    # Bar geometry for every task at once; the first task sits at the top
+    start_dates = df[start_col].to_numpy()
+    bar_widths = (df[end_col].to_numpy() - start_dates) // np.timedelta64(1, 'D')
+    starts = mdates.date2num(start_dates)
+    y_ticks = np.arange(len(df) - 1, -1, -1)
+    y_labels = df[task_col].tolist()
+    
+    # Plot every task as a horizontal bar with phase-based coloring in one call
+    ax.barh(y_ticks, 
+            bar_widths, 
+            left=starts, 
+            color=phase_color_table[phases.get_indexer(df[phase_col])],
+            height=0.5)
+    
+    # Midpoint of each bar (half its whole-day width) for text placement
+    bar_midpoints = starts + bar_widths / 2
+    
+    # Add the duration weeks as text above each bar
+    label_texts = [f"{weeks}" for weeks in df[duration_col].tolist()]
+    label_y = y_ticks + 0.25
+    label_style = dict(ha='center', va='bottom', fontproperties=LABEL_FONT, color='black')
+    
+    # Draw the white label backgrounds as one collection instead of a bbox
+    # patch per label. Boxes are sized in points (with the same 1pt padding),
+    # measured once per distinct label
+    renderer = fig.canvas.get_renderer()
+    points_per_pixel = 72 / fig.dpi
+    label_boxes = {}
+    for text in dict.fromkeys(label_texts):
+        extent = Text(0, 0, text, figure=fig, **label_style).get_window_extent(renderer)
+        half_width = extent.width * points_per_pixel / 2 + 1
+        height = extent.height * points_per_pixel + 1
+        label_boxes[text] = [(-half_width, -1), (half_width, -1), 
+                             (half_width, height), (-half_width, height)]
+    
+    ax.add_collection(PolyCollection(
+        [label_boxes[text] for text in label_texts],
+        offsets=np.column_stack([bar_midpoints, label_y]),
+        offset_transform=ax.transData,
+        transform=mtransforms.Affine2D().scale(1 / 72) + fig.dpi_scale_trans,
+        facecolors='white', edgecolors='none', alpha=0.7, 
+        zorder=3, clip_on=False), autolim=False)
+    
+    for bar_midpoint, y_pos, text in zip(bar_midpoints.tolist(), label_y.tolist(), label_texts):
+        ax.text(bar_midpoint, y_pos, text, **label_style)
     
     # Add a legend for phases
-    handles = [plt.Rectangle((0,0), 1, 1, color=color) for color in phase_colors.values()]
-    legend = ax.legend(handles, phase_colors.keys(), title="Phases", loc="upper right")
-    plt.setp(legend.get_texts(), family='Arial')
-    plt.setp(legend.get_title(), family='Arial', color='white')
+    handles = [Patch(color=color) for color in phase_colors.values()]
+    ax.legend(handles, phase_colors.keys(), title="Phases", loc="upper right")
     
     # Format the x-axis to show dates by month
     ax.xaxis_date()
     
-    # Set major ticks to be at the start of each month
-    ax.xaxis.set_major_locator(mdates.MonthLocator())
-    
-    # Format the tick labels as month abbreviation and year (e.g., "Jan 2025")
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+    # Keep the number of major ticks bounded however long the schedule is;
+    # the concise formatter labels them without repeating the year on each tick
+    locator = mdates.AutoDateLocator(minticks=3, maxticks=12)
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
     
     # Set minor ticks at the start of each week for more granularity
     ax.xaxis.set_minor_locator(mdates.WeekdayLocator(byweekday=0))  # Monday as the first day of week
     
-    # Set dark navy background color to match the image
-    fig.set_facecolor('#1a1a44')
-    ax.set_facecolor('#1a1a44')
-    
-    # Set labels with Arial font
-    ax.set_xlabel('Date', color='white', fontfamily='Arial', fontsize=11)
-    ax.set_ylabel('Task', color='white', fontfamily='Arial', fontsize=11)
-    ax.set_title('Gantt Chart by Phase', color='white', fontfamily='Arial', fontsize=14, fontweight='bold')
+    # Set labels (font and colors come from CHART_RC)
+    ax.set_xlabel('Date', fontsize=11)
+    ax.set_ylabel('Task', fontsize=11)
+    ax.set_title('Gantt Chart by Phase', fontsize=14, fontweight='bold')
     
-    # Set y-axis to show all tasks with Arial font
-    plt.yticks(y_ticks, y_labels, color='white', fontfamily='Arial')
+    # Set y-axis to show all tasks
+    ax.set_yticks(y_ticks, labels=y_labels)
     
-    # Rotate date labels for better readability with Arial font
-    plt.xticks(rotation=45, color='white', fontfamily='Arial')
+    # Rotate date labels for better readability
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Add grid lines for better readability
     ax.grid(True, axis='x', linestyle='--', alpha=0.3, color='white')
@@ -199,22 +386,22 @@ def process_excel_file(file_path):
     # Add minor grid lines for weeks
     ax.grid(True, axis='x', which='minor', linestyle=':', alpha=0.2, color='white')
     
-    # Set spine colors to white
-    for spine in ax.spines.values():
-        spine.set_color('white')
-    
-    # Set tick colors to white
-    ax.tick_params(axis='x', colors='white')
-    ax.tick_params(axis='y', colors='white')
-    
-    # Make sure legend text is white
-    for text in legend.get_texts():
-        text.set_color('white')
-    
     plt.tight_layout()
-    # Return the figure instead of showing it
-    debug_print("Returning figure from process_excel_file")
-    return fig  # Return the figure object instead of calling plt.show()
+    if return_mode == 'figure':
+        # Return the figure instead of showing it
+        debug_print("Returning figure from process_excel_file")
+        return fig  # Return the figure object instead of calling plt.show()
+    
+    # Render once and hand back only the image
+    try:
+        if return_mode == 'rgba':
+            fig.canvas.draw()
+            return np.asarray(fig.canvas.buffer_rgba()).copy()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
 
 if __name__ == "__main__":
     debug_print("Running main.py directly")